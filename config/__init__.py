@@ -1,10 +1,22 @@
 """Configuration module."""
 
-from config.settings import settings, Settings, OperatingMode
+from config.settings import (
+    settings,
+    get_settings,
+    Settings,
+    OperatingMode,
+    SHADOW,
+    ALERT,
+    NIGHT_AUTO,
+)
 
 __all__ = [
     "settings",
+    "get_settings",
     "Settings",
     "OperatingMode",
+    "SHADOW",
+    "ALERT",
+    "NIGHT_AUTO",
 ]
 
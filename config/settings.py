@@ -1,31 +1,87 @@
 """
 Configuration settings for the Polymarket Oracle-Lag Trading Bot.
-Uses pydantic-settings for validation and environment variable loading.
+Uses pydantic for validation; values come from the .env file overlaid with
+the process environment.
+
+Top-level fields map to their upper-cased name (MODE, ASSETS, ...). Sub-groups
+are reached through the "__" nested delimiter, e.g.
+SIGNALS__MIN_DIVERGENCE_PCT=0.06 or CHAINLINK__POLYGON_RPC_URL=...
+
+Fields of the main sub-groups (everything except asset_configs) are also read
+from their bare name, e.g. POLYGON_RPC_URL or DISCORD_WEBHOOK_URL, as in
+VPS_SETUP.md. The prefixed form wins when both are set.
 """
 
-from enum import Enum
-from typing import Dict, Optional
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import sys
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import cached_property, lru_cache
+from collections import abc
+from types import UnionType
+from typing import (
+    Dict, Final, Literal, Mapping, Optional, Tuple, Union,
+    get_args, get_origin, get_type_hints,
+)
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_serializer, field_validator
+from dotenv import dotenv_values
 
 
-class OperatingMode(str, Enum):
-    """Bot operating modes."""
-    SHADOW = "shadow"
-    ALERT = "alert"
-    NIGHT_AUTO = "night_auto"
+# Bot operating modes
+OperatingMode = Literal["shadow", "alert", "night_auto"]
+SHADOW: Final = "shadow"
+ALERT: Final = "alert"
+NIGHT_AUTO: Final = "night_auto"
 
+# Market volatility regime classification
+VolatilityRegime = Literal["low", "normal", "high"]
 
-class VolatilityRegime(str, Enum):
-    """Market volatility regime classification."""
-    LOW = "low"
-    NORMAL = "normal"
-    HIGH = "high"
+
+class _FrozenMap(Mapping):
+    """Read-only, hashable mapping, so frozen settings models stay hashable."""
+    
+    __slots__ = ("_data", "_hash")
+    
+    def __init__(self, data: Mapping) -> None:
+        self._data = dict(data)
+        self._hash: Optional[int] = None
+    
+    def __getitem__(self, key):
+        return self._data[key]
+    
+    def __iter__(self):
+        return iter(self._data)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
 
 
-class ExchangeSettings(BaseSettings):
+# Default asset -> exchange symbol mapping, shared by every ExchangeSettings
+_SYMBOLS: Mapping[str, Mapping[str, str]] = _FrozenMap({
+    "BTC": _FrozenMap({"binance": "btcusdt", "coinbase": "BTC-USD", "kraken": "XBT/USD"}),
+    "ETH": _FrozenMap({"binance": "ethusdt", "coinbase": "ETH-USD", "kraken": "ETH/USD"}),
+    "SOL": _FrozenMap({"binance": "solusdt", "coinbase": "SOL-USD", "kraken": "SOL/USD"}),
+    "XRP": _FrozenMap({"binance": "xrpusdt", "coinbase": "XRP-USD", "kraken": "XRP/USD"}),
+})
+
+
+class ExchangeSettings(BaseModel):
     """Settings for individual exchange connections."""
     
+    model_config = ConfigDict(frozen=True)
+    
     binance_ws_url: str = "wss://stream.binance.com:9443/ws"
     binance_symbol: str = "btcusdt"
     
@@ -35,18 +91,28 @@ class ExchangeSettings(BaseSettings):
     kraken_ws_url: str = "wss://ws.kraken.com"
     kraken_pair: str = "XBT/USD"
     
-    # Multi-asset symbols (asset -> exchange symbol mapping)
-    symbols: dict = Field(default_factory=lambda: {
-        "BTC": {"binance": "btcusdt", "coinbase": "BTC-USD", "kraken": "XBT/USD"},
-        "ETH": {"binance": "ethusdt", "coinbase": "ETH-USD", "kraken": "ETH/USD"},
-        "SOL": {"binance": "solusdt", "coinbase": "SOL-USD", "kraken": "SOL/USD"},
-        "XRP": {"binance": "xrpusdt", "coinbase": "XRP-USD", "kraken": "XRP/USD"},
-    })
+    # Multi-asset symbols (asset -> exchange symbol mapping), read-only
+    symbols: Mapping[str, Mapping[str, str]] = Field(default_factory=lambda: _SYMBOLS)
+    
+    @field_validator("symbols")
+    @classmethod
+    def _freeze_symbols(cls, v: Mapping[str, Mapping[str, str]]) -> Mapping[str, Mapping[str, str]]:
+        """Keep env-provided symbol maps read-only (and hashable) like the default."""
+        return _FrozenMap({
+            sys.intern(asset): _FrozenMap({sys.intern(ex): sym for ex, sym in m.items()})
+            for asset, m in v.items()
+        })
+    
+    @field_serializer("symbols")
+    def _dump_symbols(self, v: Mapping[str, Mapping[str, str]]) -> Dict[str, Dict[str, str]]:
+        return {asset: dict(m) for asset, m in v.items()}
 
 
-class ChainlinkSettings(BaseSettings):
+class ChainlinkSettings(BaseModel):
     """Settings for Chainlink oracle monitoring."""
     
+    model_config = ConfigDict(frozen=True)
+    
     # Polygon Mainnet Chainlink Feed Addresses
     btc_usd_feed_address: str = "0xc907E116054Ad103354f2D350FD2514433D57F6f"
     eth_usd_feed_address: str = "0xF9680D99D6C9589e2a93a78A04A279e509205945"
@@ -68,9 +134,11 @@ class ChainlinkSettings(BaseSettings):
     fast_heartbeat_threshold: int = 35  # seconds
 
 
-class PolymarketSettings(BaseSettings):
+class PolymarketSettings(BaseModel):
     """Settings for Polymarket connection."""
     
+    model_config = ConfigDict(frozen=True)
+    
     api_url: str = "https://clob.polymarket.com"
     ws_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     
@@ -79,7 +147,8 @@ class PolymarketSettings(BaseSettings):
     btc_down_market_id: str = Field(default="", description="BTC 15-min DOWN market condition ID")
 
 
-class SignalSettings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class SignalSettings:
     """Signal detection thresholds with multi-layered validation."""
     
     # ==========================================================================
@@ -143,9 +212,17 @@ class SignalSettings(BaseSettings):
     # At €1, you're trading into markets with €10-50 total liquidity
     min_liquidity_eur: float = 10.0  # Production: ensure enough liquidity to fill positions
     liquidity_collapse_threshold: float = 0.50  # 50% drop triggers alert (was 60% - too sensitive)
+    
+    # Derived values (computed once in __post_init__)
+    min_persistence_move: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        # Legacy directional-persistence fallback: half the escape-clause move
+        object.__setattr__(self, "min_persistence_move", self.escape_clause_min_move * 0.5)
 
 
-class ConfidenceWeights(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class ConfidenceWeights:
     """
     Confidence scoring component weights.
     
@@ -174,7 +251,8 @@ class ConfidenceWeights(BaseSettings):
     spread_anomaly_weight: float = 0.0   # Less relevant
 
 
-class ExecutionSettings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class ExecutionSettings:
     """Trade execution settings."""
     
     # Order settings
@@ -192,9 +270,18 @@ class ExecutionSettings(BaseSettings):
     
     # Slippage
     max_slippage_pct: float = 0.02  # 2%
+    
+    # Derived values (computed once in __post_init__)
+    max_priority_fee_wei: int = field(init=False, repr=False, compare=False)
+    max_fee_per_gas_wei: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "max_priority_fee_wei", self.max_priority_fee_gwei * 10**9)
+        object.__setattr__(self, "max_fee_per_gas_wei", self.max_fee_per_gas_gwei * 10**9)
 
 
-class RiskSettings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class RiskSettings:
     """Risk management settings."""
     
     # Capital allocation
@@ -215,9 +302,17 @@ class RiskSettings(BaseSettings):
     night_mode_min_confidence: float = 0.85
     night_mode_start_hour: int = 2  # 02:00
     night_mode_end_hour: int = 6  # 06:00
+    
+    # Derived values (computed once in __post_init__)
+    # Position size for normal modes (bankroll * max_position_pct)
+    max_position_eur: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "max_position_eur", self.starting_capital_eur * self.max_position_pct)
 
 
-class AssetSpecificSettings(BaseSettings):
+@dataclass(slots=True, frozen=True)
+class AssetSpecificSettings:
     """
     Per-asset configuration overrides.
     
@@ -255,7 +350,88 @@ class AssetSpecificSettings(BaseSettings):
     max_price: Optional[float] = None  # e.g., 0.90 = 90¢
 
 
-class AssetConfigs(BaseSettings):
+# Returned by AssetConfigs.get() for assets without overrides
+_DEFAULT_ASSET_SETTINGS = AssetSpecificSettings()
+
+# BTC: DISABLED for v2.2 - too many losses (117 losses = €-317 in testing)
+# MMs reprice too fast (4-8s), causing stop losses and liquidity collapses
+# Re-enable later with US VPS for lower latency
+_BTC_DEFAULT = AssetSpecificSettings(
+    # Signal Detection - EFFECTIVELY DISABLED
+    min_liquidity_eur=40.0,
+    min_divergence_pct=0.15,  # 15% - effectively disabled (rarely hit)
+    spot_implied_scale=100.0,
+    
+    # Staleness Window
+    optimal_staleness_min_s=4.0,
+    optimal_staleness_max_s=10.0,
+    
+    # Execution
+    time_limit_s=60.0,
+    take_profit_pct=0.06,
+    stop_loss_eur=0.035,
+    
+    volatility_scale_enabled=False,
+    
+    # Price range
+    min_price=0.05,
+    max_price=0.95,
+)
+
+# ETH: "Sensitivity" Strategy - Unlock dormant asset
+# Lower volatility means smaller moves are more significant
+# v2.3: Lowered liquidity to €8 to match SOL
+_ETH_DEFAULT = AssetSpecificSettings(
+    # Signal Detection - More sensitive
+    min_liquidity_eur=8.0,   # Production: reasonable liquidity
+    min_divergence_pct=0.05, # 5% - Production: quality ETH signals
+    spot_implied_scale=130.0, # ↑ from 100 - more sensitive to small moves
+    
+    # Staleness Window (ETH MMs slightly slower than BTC)
+    optimal_staleness_min_s=8.0,
+    optimal_staleness_max_s=15.0,
+    
+    # Execution
+    time_limit_s=90.0,        # Keep standard
+    take_profit_pct=0.06,     # ↓ from 8% - ETH doesn't overshoot
+    stop_loss_eur=0.03,       # Keep current
+    
+    # Volatility scaling - boost sensitivity during calm periods
+    volatility_scale_enabled=True,
+    volatility_scale_factor=1.3,  # 30% boost during low vol
+    
+    # Price range
+    min_price=0.08,
+    max_price=0.92,
+)
+
+# SOL: "Momentum" Strategy - THE PROFIT ENGINE
+# Slower MMs (10-15s), higher volatility = let positions breathe
+# v2.3: Lowered liquidity to €8 to catch 14-15% divergence opportunities
+_SOL_DEFAULT = AssetSpecificSettings(
+    # Signal Detection
+    min_liquidity_eur=8.0,   # Production: reasonable liquidity
+    min_divergence_pct=0.06, # 6% - Production: quality SOL signals
+    spot_implied_scale=100.0,
+    
+    # Staleness Window
+    optimal_staleness_min_s=8.0,
+    optimal_staleness_max_s=12.0,
+    
+    # Execution - Let momentum play out
+    time_limit_s=120.0,       # SOL trends longer
+    take_profit_pct=0.09,     # 9% - SOL overshoots
+    stop_loss_eur=0.03,
+    
+    volatility_scale_enabled=False,
+    
+    # Price range
+    min_price=0.10,
+    max_price=0.90,
+)
+
+
+class AssetConfigs(BaseModel):
     """
     Container for all asset-specific configurations.
     
@@ -265,112 +441,55 @@ class AssetConfigs(BaseSettings):
     - SOL: "Momentum" - Proven settings, longer hold (MMs slower, 10-15s)
     
     Usage in .env:
-        ASSET_BTC__MIN_LIQUIDITY_EUR=100
-        ASSET_ETH__MIN_DIVERGENCE_PCT=0.08
+        ASSET_CONFIGS__BTC__MIN_LIQUIDITY_EUR=100
+        ASSET_CONFIGS__ETH__MIN_DIVERGENCE_PCT=0.08
     """
     
-    # BTC: DISABLED for v2.2 - too many losses (117 losses = €-317 in testing)
-    # MMs reprice too fast (4-8s), causing stop losses and liquidity collapses
-    # Re-enable later with US VPS for lower latency
-    BTC: AssetSpecificSettings = Field(default_factory=lambda: AssetSpecificSettings(
-        # Signal Detection - EFFECTIVELY DISABLED
-        min_liquidity_eur=40.0,
-        min_divergence_pct=0.15,  # 15% - effectively disabled (rarely hit)
-        spot_implied_scale=100.0,
-        
-        # Staleness Window
-        optimal_staleness_min_s=4.0,
-        optimal_staleness_max_s=10.0,
-        
-        # Execution
-        time_limit_s=60.0,
-        take_profit_pct=0.06,
-        stop_loss_eur=0.035,
-        
-        volatility_scale_enabled=False,
-        
-        # Price range
-        min_price=0.05,
-        max_price=0.95,
-    ))
-    
-    # ETH: "Sensitivity" Strategy - Unlock dormant asset
-    # Lower volatility means smaller moves are more significant
-    # v2.3: Lowered liquidity to €8 to match SOL
-    ETH: AssetSpecificSettings = Field(default_factory=lambda: AssetSpecificSettings(
-        # Signal Detection - More sensitive
-        min_liquidity_eur=8.0,   # Production: reasonable liquidity
-        min_divergence_pct=0.05, # 5% - Production: quality ETH signals
-        spot_implied_scale=130.0, # ↑ from 100 - more sensitive to small moves
-        
-        # Staleness Window (ETH MMs slightly slower than BTC)
-        optimal_staleness_min_s=8.0,
-        optimal_staleness_max_s=15.0,
-        
-        # Execution
-        time_limit_s=90.0,        # Keep standard
-        take_profit_pct=0.06,     # ↓ from 8% - ETH doesn't overshoot
-        stop_loss_eur=0.03,       # Keep current
-        
-        # Volatility scaling - boost sensitivity during calm periods
-        volatility_scale_enabled=True,
-        volatility_scale_factor=1.3,  # 30% boost during low vol
-        
-        # Price range
-        min_price=0.08,
-        max_price=0.92,
-    ))
-    
-    # SOL: "Momentum" Strategy - THE PROFIT ENGINE
-    # Slower MMs (10-15s), higher volatility = let positions breathe
-    # v2.3: Lowered liquidity to €8 to catch 14-15% divergence opportunities
-    SOL: AssetSpecificSettings = Field(default_factory=lambda: AssetSpecificSettings(
-        # Signal Detection
-        min_liquidity_eur=8.0,   # Production: reasonable liquidity
-        min_divergence_pct=0.06, # 6% - Production: quality SOL signals
-        spot_implied_scale=100.0,
-        
-        # Staleness Window
-        optimal_staleness_min_s=8.0,
-        optimal_staleness_max_s=12.0,
-        
-        # Execution - Let momentum play out
-        time_limit_s=120.0,       # SOL trends longer
-        take_profit_pct=0.09,     # 9% - SOL overshoots
-        stop_loss_eur=0.03,
-        
-        volatility_scale_enabled=False,
-        
-        # Price range
-        min_price=0.10,
-        max_price=0.90,
-    ))
+    model_config = ConfigDict(frozen=True)
+    
+    BTC: AssetSpecificSettings = _BTC_DEFAULT  # "Scalpel" (currently disabled)
+    ETH: AssetSpecificSettings = _ETH_DEFAULT  # "Sensitivity"
+    SOL: AssetSpecificSettings = _SOL_DEFAULT  # "Momentum"
+    
+    @cached_property
+    def _by_name(self) -> Dict[str, AssetSpecificSettings]:
+        return {name: getattr(self, name) for name in type(self).model_fields}
     
     def get(self, asset: str) -> AssetSpecificSettings:
         """Get settings for a specific asset, with defaults."""
-        return getattr(self, asset.upper(), AssetSpecificSettings())
+        return self._by_name.get(asset.upper(), _DEFAULT_ASSET_SETTINGS)
 
 
-class AlertSettings(BaseSettings):
+class AlertSettings(BaseModel):
     """Discord alerting settings."""
     
+    model_config = ConfigDict(frozen=True)
+    
     discord_webhook_url: str = Field(default="", description="Discord webhook URL")
     alert_confidence_threshold: float = 0.50  # Lowered from 0.70 - max possible is ~80%
     alert_cooldown_seconds: int = 30
 
 
-class Settings(BaseSettings):
+# Default sub-group instances, built once and shared by every Settings().
+# Groups overridden through the environment are validated per instance.
+_EXCHANGES = ExchangeSettings()
+_CHAINLINK = ChainlinkSettings()
+_POLYMARKET = PolymarketSettings()
+_SIGNALS = SignalSettings()
+_CONFIDENCE = ConfidenceWeights()
+_EXECUTION = ExecutionSettings()
+_RISK = RiskSettings()
+_ALERTS = AlertSettings()
+_ASSET_CONFIGS = AssetConfigs()
+
+
+class Settings(BaseModel):
     """Main application settings."""
     
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        env_nested_delimiter="__",
-        extra="ignore"
-    )
+    model_config = ConfigDict(frozen=True)
     
     # Operating mode
-    mode: OperatingMode = OperatingMode.SHADOW
+    mode: OperatingMode = SHADOW
     
     # Real trading toggle (requires private_key to be set)
     real_trading_enabled: bool = Field(default=False, description="Enable real trading with actual money - DISABLED until exit bug fixed")
@@ -378,7 +497,7 @@ class Settings(BaseSettings):
     real_trading_max_daily_loss_eur: float = Field(default=25.0, description="Max daily loss before pausing real trades")
     real_trading_max_concurrent_positions: int = Field(default=3, description="Max concurrent real positions")
     
-    # Assets to trade (comma-separated)
+    # Assets to trade (comma-separated) - read the parsed form via asset_list
     assets: str = Field(default="BTC", description="Comma-separated list of assets to trade (BTC,ETH,SOL,XRP)")
     
     # Debug settings
@@ -393,15 +512,15 @@ class Settings(BaseSettings):
     private_key: str = Field(default="", description="Your wallet private key (keep secure!)")
     
     # Sub-settings
-    exchanges: ExchangeSettings = Field(default_factory=ExchangeSettings)
-    chainlink: ChainlinkSettings = Field(default_factory=ChainlinkSettings)
-    polymarket: PolymarketSettings = Field(default_factory=PolymarketSettings)
-    signals: SignalSettings = Field(default_factory=SignalSettings)
-    confidence: ConfidenceWeights = Field(default_factory=ConfidenceWeights)
-    execution: ExecutionSettings = Field(default_factory=ExecutionSettings)
-    risk: RiskSettings = Field(default_factory=RiskSettings)
-    alerts: AlertSettings = Field(default_factory=AlertSettings)
-    asset_configs: AssetConfigs = Field(default_factory=AssetConfigs)
+    exchanges: ExchangeSettings = Field(default_factory=lambda: _EXCHANGES)
+    chainlink: ChainlinkSettings = Field(default_factory=lambda: _CHAINLINK)
+    polymarket: PolymarketSettings = Field(default_factory=lambda: _POLYMARKET)
+    signals: SignalSettings = Field(default_factory=lambda: _SIGNALS)
+    confidence: ConfidenceWeights = Field(default_factory=lambda: _CONFIDENCE)
+    execution: ExecutionSettings = Field(default_factory=lambda: _EXECUTION)
+    risk: RiskSettings = Field(default_factory=lambda: _RISK)
+    alerts: AlertSettings = Field(default_factory=lambda: _ALERTS)
+    asset_configs: AssetConfigs = Field(default_factory=lambda: _ASSET_CONFIGS)
     
     # Feed health
     heartbeat_interval_seconds: float = 2.0
@@ -413,8 +532,192 @@ class Settings(BaseSettings):
     min_signals_per_day: int = 5
     max_signals_per_day: int = 15
     max_e2e_latency_ms: int = 200
+    
+    @cached_property
+    def asset_list(self) -> Tuple[str, ...]:
+        """Configured assets, upper-cased and interned, parsed once from `assets`."""
+        # Interned so per-asset dict lookups downstream hit the identity fast path
+        return tuple(sys.intern(a.strip().upper()) for a in self.assets.split(",") if a.strip())
+
+
+# Singleton instance
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """Get settings singleton (parses the environment on first call only)."""
+    global _settings
+    if _settings is None:
+        _settings = _validate_env(frozenset(_read_env().items()))
+    return _settings
+
+
+# Compiled once at import; every load feeds it a plain dict.
+_SETTINGS_VALIDATOR = Settings.__pydantic_validator__
+
+
+def _read_env(env_file: str = ".env") -> Dict[str, str]:
+    """Read the .env file (if present) overlaid with the process environment."""
+    try:
+        with open(env_file, "rb") as f:
+            raw = f.read()
+    except FileNotFoundError:
+        raw = b""
+    env = dict(_parse_env_text(raw))
+    env.update(os.environ)
+    return env
+
+
+# Parsed .env contents by 16-byte blake2b digest of the raw file (oldest evicted)
+_ENV_PARSE_CACHE: Dict[bytes, Tuple[Tuple[str, str], ...]] = {}
+_ENV_PARSE_CACHE_SIZE = 2
+
+
+def _parse_env_text(raw: bytes) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse .env contents, cached on their digest only.
+    
+    A reload triggered without the file content changing (touch, log
+    rotation) skips the dotenv parse; the resulting snapshot then hits the
+    `_validate_env` cache as well. Parse errors propagate and are not cached.
+    """
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    items = _ENV_PARSE_CACHE.get(digest)
+    if items is None:
+        text = raw.decode("utf-8")
+        items = tuple(
+            (key, value)
+            for key, value in dotenv_values(stream=io.StringIO(text)).items()
+            if value is not None
+        )
+        if len(_ENV_PARSE_CACHE) >= _ENV_PARSE_CACHE_SIZE:
+            del _ENV_PARSE_CACHE[next(iter(_ENV_PARSE_CACHE))]
+        _ENV_PARSE_CACHE[digest] = items
+    return items
+
+
+def _nest_env(env: Mapping[str, str]) -> dict:
+    """
+    Fold flat environment keys into the nested dict Settings expects.
+    
+    Names are case-insensitive, "__" descends into a sub-group and JSON values
+    are decoded for complex fields (e.g. EXCHANGES__SYMBOLS). Keys that don't
+    name a field are ignored, so the full process environment can be passed.
+    """
+    nested: dict = {}
+    for key, value in env.items():
+        group, target = Settings, nested
+        *parents, leaf = key.split("__")
+        for part in parents:
+            name, annotation = _group_fields(group).get(part.lower(), (None, None))
+            if not _is_group(annotation):
+                break
+            group, target = annotation, target.setdefault(name, {})
+        else:
+            name, annotation = _group_fields(group).get(leaf.lower(), (None, None))
+            if name is None:
+                continue
+            target[name] = _env_value(key, value, annotation)
+    
+    # Bare sub-group field names (POLYGON_RPC_URL, ...) fill whatever the
+    # prefixed keys above left unset
+    unprefixed = _unprefixed_fields()
+    for key, value in env.items():
+        for group_name, name, annotation in unprefixed.get(key.lower(), ()):
+            target = nested.setdefault(group_name, {})
+            if isinstance(target, dict) and name not in target:
+                target[name] = _env_value(key, value, annotation)
+    return nested
+
+
+def _env_value(key: str, value: str, annotation):
+    """
+    Decode JSON values for complex fields (e.g. EXCHANGES__SYMBOLS).
+    
+    Scalar fields keep the raw string even if it looks like JSON; invalid
+    JSON for a complex field is reported as a ValidationError.
+    """
+    if value[:1] not in ("{", "[") or not _is_complex(annotation):
+        return value
+    try:
+        return json.loads(value)
+    except json.JSONDecodeError as e:
+        raise ValidationError.from_exception_data(
+            Settings.__name__,
+            [{"type": "json_invalid", "loc": (key,), "input": value, "ctx": {"error": str(e)}}],
+        ) from None
+
+
+def _is_complex(annotation) -> bool:
+    """Whether a field takes structured (JSON) values: groups and containers."""
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return any(_is_complex(arg) for arg in get_args(annotation) if arg is not type(None))
+    kind = origin or annotation
+    return _is_group(kind) or (
+        isinstance(kind, type) and issubclass(kind, (abc.Mapping, list, tuple, set, frozenset))
+    )
+
+
+# Sub-groups whose fields may also be set without the GROUP__ prefix. Each of
+# these used to read the environment on its own; asset_configs never did.
+_UNPREFIXED_GROUPS = (
+    "exchanges", "chainlink", "polymarket", "signals",
+    "confidence", "execution", "risk", "alerts",
+)
+
+
+@lru_cache(maxsize=None)
+def _unprefixed_fields() -> Dict[str, Tuple[Tuple[str, str, type], ...]]:
+    """Map lower-cased bare field names to the (group, field, annotation) they set."""
+    by_leaf: Dict[str, list] = {}
+    settings_fields = _group_fields(Settings)
+    for group_name in _UNPREFIXED_GROUPS:
+        for leaf, (name, annotation) in _group_fields(settings_fields[group_name][1]).items():
+            by_leaf.setdefault(leaf, []).append((group_name, name, annotation))
+    return {leaf: tuple(pairs) for leaf, pairs in by_leaf.items()}
+
+
+def _is_group(annotation) -> bool:
+    """Settings groups are either pydantic models or (slotted) dataclasses."""
+    return isinstance(annotation, type) and (
+        issubclass(annotation, BaseModel) or is_dataclass(annotation)
+    )
+
+
+@lru_cache(maxsize=None)
+def _group_fields(group: type) -> Dict[str, Tuple[str, type]]:
+    """Map lower-cased field names of a settings group to (name, annotation)."""
+    if is_dataclass(group):
+        # Resolved hints: f.type is a string under `from __future__ import annotations`
+        hints = get_type_hints(group)
+        return {f.name.lower(): (f.name, hints[f.name]) for f in fields(group) if f.init}
+    return {name.lower(): (name, info.annotation) for name, info in group.model_fields.items()}
+
+
+@lru_cache(maxsize=4)
+def _validate_env(env_items: frozenset) -> Settings:
+    """Validate an env snapshot; identical snapshots return the cached instance."""
+    return _SETTINGS_VALIDATOR.validate_python(_nest_env(dict(env_items)))
+
+
+def reload_settings(env: Optional[Mapping[str, str]] = None) -> Settings:
+    """
+    Rebuild the settings singleton.
+    
+    Args:
+        env: Flat environment mapping (e.g. parsed .env contents). When
+            omitted, the .env file and process environment are re-read.
+    
+    Note: modules that bound `settings` at import keep the previous instance.
+    """
+    global _settings
+    if env is None:
+        env = _read_env()
+    _settings = _validate_env(frozenset(env.items()))
+    return _settings
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
@@ -22,6 +22,98 @@ import aiohttp
 import ssl
 import certifi
 import os
+from typing import Optional, Tuple
+
+
+async def probe_ip(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 1: Get our IP."""
+    async with session.get(
+        "https://api.ipify.org?format=json",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            return True, f"✅ Your IP: {data.get('ip')}"
+        return False, f"❌ Failed: {resp.status}"
+
+
+async def probe_gamma(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 2: Polymarket Gamma API (market data - should work)."""
+    async with session.get(
+        "https://gamma-api.polymarket.com/markets?active=true&limit=3",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            return True, f"✅ OK - Found {len(data)} markets"
+        return False, f"❌ Failed: {resp.status}"
+
+
+async def probe_clob(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 3: Polymarket CLOB time endpoint."""
+    async with session.get(
+        "https://clob.polymarket.com/time",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            return True, "✅ OK - CLOB accessible"
+        return False, f"⚠️ Status {resp.status} - May be rate limited"
+
+
+async def probe_binance(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 4: Binance API (always works)."""
+    async with session.get(
+        "https://api.binance.com/api/v3/ticker/price?symbol=ETHUSDT",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            return True, f"✅ OK - ETH = ${float(data['price']):,.2f}"
+        return False, f"❌ Failed: {resp.status}"
+
+
+async def probe_coinbase(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 5: Coinbase API."""
+    async with session.get(
+        "https://api.coinbase.com/v2/prices/ETH-USD/spot",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            return True, f"✅ OK - ETH = ${float(data['data']['amount']):,.2f}"
+        return False, f"❌ Failed: {resp.status}"
+
+
+async def probe_kraken(session: aiohttp.ClientSession, proxy_url: Optional[str]) -> Tuple[bool, str]:
+    """Test 6: Kraken API."""
+    async with session.get(
+        "https://api.kraken.com/0/public/Ticker?pair=ETHUSD",
+        proxy=proxy_url,
+        timeout=10,
+    ) as resp:
+        if resp.status == 200:
+            data = await resp.json()
+            if data.get("result"):
+                price = list(data["result"].values())[0]["c"][0]
+                return True, f"✅ OK - ETH = ${float(price):,.2f}"
+            return True, "✅ OK"
+        return False, f"❌ Failed: {resp.status}"
+
+
+# (result key, heading, probe, icon for transport errors) - printed in this order
+PROBES = [
+    ("ip", "1️⃣ Checking your IP address...", probe_ip, "❌"),
+    ("gamma_api", "2️⃣ Testing Polymarket Gamma API (market discovery)...", probe_gamma, "❌"),
+    ("clob_api", "3️⃣ Testing Polymarket CLOB API (trading endpoint)...", probe_clob, "⚠️"),
+    ("binance", "4️⃣ Testing Binance API (exchange prices)...", probe_binance, "❌"),
+    ("coinbase", "5️⃣ Testing Coinbase API (exchange prices)...", probe_coinbase, "❌"),
+    ("kraken", "6️⃣ Testing Kraken API (exchange prices)...", probe_kraken, "❌"),
+]
 
 
 async def main():
@@ -46,129 +138,24 @@ async def main():
     results = {}
     
     async with aiohttp.ClientSession(connector=connector) as session:
-        # Test 1: Get our IP
-        print("1️⃣ Checking your IP address...")
-        try:
-            async with session.get(
-                "https://api.ipify.org?format=json",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    ip = data.get("ip")
-                    results["ip"] = ip
-                    print(f"   ✅ Your IP: {ip}")
-                else:
-                    print(f"   ❌ Failed: {resp.status}")
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 2: Polymarket Gamma API (market data - should work)
-        print("2️⃣ Testing Polymarket Gamma API (market discovery)...")
-        try:
-            async with session.get(
-                "https://gamma-api.polymarket.com/markets?active=true&limit=3",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    results["gamma_api"] = True
-                    print(f"   ✅ OK - Found {len(data)} markets")
-                else:
-                    results["gamma_api"] = False
-                    print(f"   ❌ Failed: {resp.status}")
-        except Exception as e:
-            results["gamma_api"] = False
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 3: Polymarket CLOB time endpoint
-        print("3️⃣ Testing Polymarket CLOB API (trading endpoint)...")
-        try:
-            async with session.get(
-                "https://clob.polymarket.com/time",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    results["clob_api"] = True
-                    print(f"   ✅ OK - CLOB accessible")
-                else:
-                    results["clob_api"] = False
-                    print(f"   ⚠️ Status {resp.status} - May be rate limited")
-        except Exception as e:
-            results["clob_api"] = False
-            print(f"   ⚠️ Error: {e}")
-        print()
-        
-        # Test 4: Binance API (always works)
-        print("4️⃣ Testing Binance API (exchange prices)...")
-        try:
-            async with session.get(
-                "https://api.binance.com/api/v3/ticker/price?symbol=ETHUSDT",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    results["binance"] = True
-                    print(f"   ✅ OK - ETH = ${float(data['price']):,.2f}")
-                else:
-                    results["binance"] = False
-                    print(f"   ❌ Failed: {resp.status}")
-        except Exception as e:
-            results["binance"] = False
-            print(f"   ❌ Error: {e}")
-        print()
-        
-        # Test 5: Coinbase API
-        print("5️⃣ Testing Coinbase API (exchange prices)...")
-        try:
-            async with session.get(
-                "https://api.coinbase.com/v2/prices/ETH-USD/spot",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    results["coinbase"] = True
-                    print(f"   ✅ OK - ETH = ${float(data['data']['amount']):,.2f}")
-                else:
-                    results["coinbase"] = False
-                    print(f"   ❌ Failed: {resp.status}")
-        except Exception as e:
-            results["coinbase"] = False
-            print(f"   ❌ Error: {e}")
+        # Run all probes concurrently: wall time is the slowest probe, not the sum
+        outcomes = await asyncio.gather(
+            *(probe(session, proxy_url) for _, _, probe, _ in PROBES),
+            return_exceptions=True,
+        )
+    
+    # Report in the original order
+    for (key, heading, _, error_icon), outcome in zip(PROBES, outcomes):
+        print(heading)
+        if isinstance(outcome, BaseException):
+            results[key] = False
+            print(f"   {error_icon} Error: {outcome}")
+        else:
+            results[key], message = outcome
+            print(f"   {message}")
         print()
-        
-        # Test 6: Kraken API
-        print("6️⃣ Testing Kraken API (exchange prices)...")
-        try:
-            async with session.get(
-                "https://api.kraken.com/0/public/Ticker?pair=ETHUSD",
-                proxy=proxy_url,
-                timeout=10,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    results["kraken"] = True
-                    if data.get("result"):
-                        price = list(data["result"].values())[0]["c"][0]
-                        print(f"   ✅ OK - ETH = ${float(price):,.2f}")
-                    else:
-                        print(f"   ✅ OK")
-                else:
-                    results["kraken"] = False
-                    print(f"   ❌ Failed: {resp.status}")
-        except Exception as e:
-            results["kraken"] = False
-            print(f"   ❌ Error: {e}")
     
     # Summary
-    print()
     print("=" * 60)
     print("📋 SUMMARY")
     print("=" * 60)
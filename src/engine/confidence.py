@@ -14,29 +14,74 @@ Supporting factors (40% weight):
 - Consensus strength, liquidity, volume surge, spike concentration
 """
 
+import logging
 import math
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Dict, Optional, Tuple, TYPE_CHECKING
 
 import structlog
 
 from src.models.schemas import (
     SignalCandidate,
+    SignalDirection,
+    SignalType,
     ScoringData,
     ConfidenceBreakdown,
 )
-from config.settings import settings
+from config.settings import ConfidenceWeights, settings
 
 if TYPE_CHECKING:
     from src.utils.time_filter import TimeOfDayAnalyzer
 
 logger = structlog.get_logger()
 
+# Confidence tiers: a score >= _TIER_THRESHOLDS[i] reaches _TIERS[i + 1]
+_TIER_THRESHOLDS = (0.55, 0.65, 0.75, 0.85)
+_TIERS = (
+    "POOR (★☆☆☆☆)",
+    "LOW (★★☆☆☆)",
+    "MODERATE (★★★☆☆)",
+    "GOOD (★★★★☆)",
+    "HIGH (★★★★★)",
+)
+
+# Maker-advantage buckets (see ConfidenceScorer._score_maker_advantage)
+_SPREAD_EDGES = (0.02, 0.05)
+_SPREAD_SCORES = (1.0, 0.7, 0.3)
+_TAKER_FEE_EDGES = (0.010, 0.015)
+_TAKER_FEE_SCORES = (0.5, 0.7, 1.0)
+
+
+def _weighted_sum_for(weights: ConfidenceWeights) -> Callable[..., float]:
+    """
+    Bind the confidence weights into a closure once.
+    
+    The returned function reads the weights as closure cells, so the
+    per-signal combine is plain float arithmetic with no attribute lookups.
+    """
+    w_div = weights.divergence_weight
+    w_stale = weights.pm_staleness_weight
+    w_cons = weights.consensus_strength_weight
+    w_liq = weights.liquidity_weight
+    w_vol = weights.volume_surge_weight
+    w_spike = weights.spike_concentration_weight
+    w_maker = weights.maker_advantage_weight
+    
+    def weighted_sum(div, stale, cons, liq, vol, spike, maker) -> float:
+        return (
+            w_div * div + w_stale * stale + w_cons * cons + w_liq * liq +
+            w_vol * vol + w_spike * spike + w_maker * maker
+        )
+    
+    return weighted_sum
+
 
 def calculate_spot_implied_prob(momentum: float, scale: float = 100.0) -> float:
     """Convert spot momentum to implied probability."""
-    # Logistic function: momentum in decimal (0.01 = 1%), scale adjusts sensitivity
-    return 1 / (1 + math.exp(-momentum * scale))
+    # Logistic function: momentum in decimal (0.01 = 1%), scale adjusts sensitivity.
+    # Written via tanh (same value) so extreme moves saturate instead of overflowing exp().
+    return 0.5 * (1.0 + math.tanh(0.5 * momentum * scale))
 
 
 class ConfidenceScorer:
@@ -58,8 +103,24 @@ class ConfidenceScorer:
     
     def __init__(self, time_analyzer: Optional["TimeOfDayAnalyzer"] = None):
         self.logger = logger.bind(component="confidence_scorer")
-        self.weights = settings.confidence
+        # Debug events format a dozen values per signal; skip them when filtered out
+        self._debug = self.logger.is_enabled_for(logging.DEBUG)
+        self.set_weights(settings.confidence)
         self._time_analyzer = time_analyzer
+        
+        # Staleness window, read once: linear 1.0 -> 0.5 penalty between the two
+        self._soft_stale = settings.signals.soft_stale_threshold_seconds
+        self._max_stale = settings.signals.max_pm_staleness_seconds
+        stale_range = self._max_stale - self._soft_stale
+        self._stale_slope = 0.5 / stale_range if stale_range > 0 else 0.0
+        
+        # Per-asset (scale, min_div, 1 / scoring range), filled on first use
+        self._divergence_params: Dict[str, Tuple[float, float, float]] = {}
+    
+    def set_weights(self, weights: ConfidenceWeights) -> None:
+        """Set the confidence weights (e.g. after a settings reload)."""
+        self.weights = weights
+        self._weighted_sum = _weighted_sum_for(weights)
     
     def set_time_analyzer(self, analyzer: "TimeOfDayAnalyzer") -> None:
         """Set or update the time-of-day analyzer."""
@@ -88,10 +149,10 @@ class ConfidenceScorer:
         - ETH: 6.5% threshold, wider range for sensitivity (6.5-10%)
         - SOL: 8% threshold, proven range (8-12%)
         """
-        # Get asset-specific settings
-        asset_config = settings.asset_configs.get(asset)
-        scale = asset_config.spot_implied_scale or settings.signals.spot_implied_scale
-        min_div = asset_config.min_divergence_pct or settings.signals.min_divergence_pct
+        params = self._divergence_params.get(asset)
+        if params is None:
+            params = self._divergence_params[asset] = self._divergence_params_for(asset)
+        scale, min_div, inv_range = params
         
         # Calculate spot-implied probability (using asset-specific scale)
         spot_implied = calculate_spot_implied_prob(
@@ -102,6 +163,18 @@ class ConfidenceScorer:
         # Calculate divergence
         divergence = abs(spot_implied - pm_yes_price)
         
+        if divergence < min_div:
+            return 0.0
+        
+        return min(1.0, (divergence - min_div) * inv_range)
+    
+    def _divergence_params_for(self, asset: str) -> Tuple[float, float, float]:
+        """Resolve the asset's implied-prob scale, min divergence and inverse scoring range."""
+        # Get asset-specific settings
+        asset_config = settings.asset_configs.get(asset)
+        scale = asset_config.spot_implied_scale or settings.signals.spot_implied_scale
+        min_div = asset_config.min_divergence_pct or settings.signals.min_divergence_pct
+        
         # Asset-specific scoring ranges
         # For each asset, perfect score at min_div + 4-5%
         if asset == "BTC":
@@ -114,10 +187,7 @@ class ConfidenceScorer:
             # SOL: 8% threshold → perfect at 12%
             max_div = min_div + 0.04  # ~12%
         
-        if divergence < min_div:
-            return 0.0
-        
-        return min(1.0, (divergence - min_div) / (max_div - min_div))
+        return scale, min_div, 1.0 / (max_div - min_div)
     
     def _score_pm_staleness(self, orderbook_age_seconds: float) -> float:
         """
@@ -129,17 +199,12 @@ class ConfidenceScorer:
         - 45-60s: Soft penalty (1.0 → 0.5) - Getting stale
         - Over 60s: Reject (0.0) - Data too old
         """
-        soft_stale = settings.signals.soft_stale_threshold_seconds  # 45s
-        max_age = settings.signals.max_pm_staleness_seconds  # 60s
-        
-        if orderbook_age_seconds <= soft_stale:
+        if orderbook_age_seconds <= self._soft_stale:
             # Fresh to normal age - NO PENALTY (this is GOOD!)
             return 1.0
-        elif orderbook_age_seconds <= max_age:
+        elif orderbook_age_seconds <= self._max_stale:
             # Getting stale - linear penalty from 1.0 to 0.5
-            penalty_range = max_age - soft_stale
-            excess_age = orderbook_age_seconds - soft_stale
-            return 1.0 - (0.5 * excess_age / penalty_range)
+            return 1.0 - (orderbook_age_seconds - self._soft_stale) * self._stale_slope
         else:
             # Too stale - reject
             return 0.0
@@ -156,7 +221,7 @@ class ConfidenceScorer:
         """
         Score exchange consensus quality (0.0 - 1.0).
         """
-        return (agreement_score + move_consistency) / 2
+        return (agreement_score + move_consistency) * 0.5
     
     def _score_liquidity(
         self,
@@ -186,7 +251,7 @@ class ConfidenceScorer:
         if volume_ratio <= 1.0:
             return 0.0
         
-        return min(1.0, (volume_ratio - 1.0) / 1.5)
+        return min(1.0, (volume_ratio - 1.0) * (1 / 1.5))
     
     def _score_spike_concentration(self, concentration: float) -> float:
         """
@@ -196,7 +261,7 @@ class ConfidenceScorer:
         if concentration <= 0.4:
             return 0.0
         
-        return min(1.0, (concentration - 0.4) / 0.3)
+        return min(1.0, (concentration - 0.4) * (1 / 0.3))
     
     def _score_obi_bonus(
         self,
@@ -288,35 +353,22 @@ class ConfidenceScorer:
         # Calculate taker fee (what we'd pay if we take)
         taker_fee = pm_data.calculate_effective_fee(side, current_price, is_maker=False)
         
-        scores = []
-        
         # 1. Low-fee zone bonus (20-80% odds = 0.2-1.1% fees)
+        # (50% odds carry the worst fees, 1.6-3%, but sit inside the sweet spot)
         if 0.20 <= current_price <= 0.80:
-            scores.append(1.0)  # Sweet spot
+            price_score = 1.0  # Sweet spot
         elif 0.15 <= current_price <= 0.85:
-            scores.append(0.7)
-        elif 0.45 <= current_price <= 0.55:
-            scores.append(0.2)  # 50% odds = worst fees (1.6-3%)
+            price_score = 0.7
         else:
-            scores.append(0.5)
+            price_score = 0.5
         
-        # 2. Spread tightness (tight spread = easy to make)
-        if spread < 0.02:  # <2%
-            scores.append(1.0)
-        elif spread < 0.05:  # <5%
-            scores.append(0.7)
-        else:
-            scores.append(0.3)
+        # 2. Spread tightness (tight spread = easy to make): <2%, <5%, wider
+        spread_score = _SPREAD_SCORES[bisect_right(_SPREAD_EDGES, spread)]
         
-        # 3. Taker fee avoidance value (higher fees = more valuable to make)
-        if taker_fee > 0.015:  # >1.5%
-            scores.append(1.0)  # High value to avoid
-        elif taker_fee > 0.010:  # >1.0%
-            scores.append(0.7)
-        else:
-            scores.append(0.5)
+        # 3. Taker fee avoidance value (higher fees = more valuable to make): <=1%, <=1.5%, above
+        fee_score = _TAKER_FEE_SCORES[bisect_left(_TAKER_FEE_EDGES, taker_fee)]
         
-        return sum(scores) / len(scores)
+        return (price_score + spread_score + fee_score) / 3
     
     # ==========================================================================
     # Main Scoring Method
@@ -357,14 +409,15 @@ class ConfidenceScorer:
         pm_staleness_score = self._score_pm_staleness(pm.orderbook_age_seconds)
         
         # Debug logging
-        self.logger.debug(
-            "Confidence calculation",
-            spot_move=f"{consensus.move_30s_pct:.4%}",
-            pm_yes=f"{pm.yes_bid:.2f}",
-            pm_age=f"{pm.orderbook_age_seconds:.0f}s",
-            div_score=f"{divergence_score:.2f}",
-            staleness_score=f"{pm_staleness_score:.2f}",
-        )
+        if self._debug:
+            self.logger.debug(
+                "Confidence calculation",
+                spot_move=f"{consensus.move_30s_pct:.4%}",
+                pm_yes=f"{pm.yes_bid:.2f}",
+                pm_age=f"{pm.orderbook_age_seconds:.0f}s",
+                div_score=f"{divergence_score:.2f}",
+                staleness_score=f"{pm_staleness_score:.2f}",
+            )
         
         # ======================
         # Supporting Factors (30%)
@@ -381,20 +434,35 @@ class ConfidenceScorer:
             pm.liquidity_30s_ago,
         )
         
+        # Zero-weighted components are skipped entirely (they can't move the total)
+        weights = self.weights
+        
+        # The bonus scorers compare against "UP"/"DOWN", not the enum values
+        direction = "DOWN" if signal.direction is SignalDirection.DOWN else "UP"
+        
         # Volume surge score - FIXED: Now uses Z-score calculation
-        volume_score = self._score_volume_surge(consensus.volume_surge_ratio)
+        volume_score = (
+            self._score_volume_surge(consensus.volume_surge_ratio)
+            if weights.volume_surge_weight else 0.0
+        )
         
-        # Spike concentration score - DISABLED (always returns 0%)
-        spike_score = 0.0  # self._score_spike_concentration(consensus.spike_concentration)
+        # Spike concentration score - DISABLED by default (weight 0)
+        spike_score = (
+            self._score_spike_concentration(consensus.spike_concentration)
+            if weights.spike_concentration_weight else 0.0
+        )
         
-        # Maker advantage score - DISABLED (reduce noise)
-        maker_score = 0.0  # self._score_maker_advantage(...)
+        # Maker advantage score - DISABLED by default (weight 0, reduce noise)
+        maker_score = (
+            self._score_maker_advantage(pm, direction)
+            if weights.maker_advantage_weight else 0.0
+        )
         
         # NEW: OBI (Order Book Imbalance) bonus - up to +10% confidence
         # Strong imbalance confirming direction = high conviction
         obi_bonus = self._score_obi_bonus(
             pm.orderbook_imbalance_ratio,
-            signal.direction.value if signal.direction else "UP",
+            direction,
         )
         
         # NEW: Orderbook freeze bonus - up to +15% confidence
@@ -416,14 +484,9 @@ class ConfidenceScorer:
         )
         
         # Calculate weighted confidence
-        confidence = (
-            self.weights.divergence_weight * divergence_score +
-            self.weights.pm_staleness_weight * pm_staleness_score +
-            self.weights.consensus_strength_weight * consensus_score +
-            self.weights.liquidity_weight * liquidity_score +
-            self.weights.volume_surge_weight * volume_score +
-            self.weights.spike_concentration_weight * spike_score +
-            self.weights.maker_advantage_weight * maker_score
+        confidence = self._weighted_sum(
+            divergence_score, pm_staleness_score, consensus_score,
+            liquidity_score, volume_score, spike_score, maker_score,
         )
         
         # Add OBI bonus (up to +10% confidence when OBI confirms direction)
@@ -433,7 +496,7 @@ class ConfidenceScorer:
         confidence += freeze_bonus
         
         # Log if OBI boost applied
-        if obi_bonus > 0.01:
+        if obi_bonus > 0.01 and self._debug:
             self.logger.debug(
                 "OBI confidence boost applied",
                 obi_ratio=f"{pm.orderbook_imbalance_ratio:+.2f}",
@@ -452,17 +515,18 @@ class ConfidenceScorer:
         # Apply probability normalization penalty (if YES + NO != 1.0)
         _, _, prob_penalty = pm.get_normalized_probabilities()
         if prob_penalty < 1.0:
-            self.logger.debug(
-                "Probability normalization penalty applied",
-                yes_bid=f"{pm.yes_bid:.3f}",
-                no_bid=f"{pm.no_bid:.3f}",
-                sum=f"{pm.yes_bid + pm.no_bid:.3f}",
-                penalty=f"{prob_penalty:.2f}",
-            )
+            if self._debug:
+                self.logger.debug(
+                    "Probability normalization penalty applied",
+                    yes_bid=f"{pm.yes_bid:.3f}",
+                    no_bid=f"{pm.no_bid:.3f}",
+                    sum=f"{pm.yes_bid + pm.no_bid:.3f}",
+                    penalty=f"{prob_penalty:.2f}",
+                )
             confidence *= prob_penalty
         
         # Apply escape clause penalty (if applicable)
-        escape_clause_used = signal.signal_type.value == "escape_clause"
+        escape_clause_used = signal.signal_type is SignalType.ESCAPE_CLAUSE
         confidence_penalty = 0.0
         
         if escape_clause_used:
@@ -470,31 +534,30 @@ class ConfidenceScorer:
             confidence *= (1 - confidence_penalty)
         
         # Time-of-day adjustment (optional)
-        time_multiplier = 1.0
-        current_hour = datetime.now().hour
-        
+        # (the wall-clock hour is only read when an analyzer is attached)
         if self._time_analyzer:
-            time_multiplier = self._time_analyzer.get_confidence_multiplier(current_hour)
+            time_multiplier = self._time_analyzer.get_confidence_multiplier(datetime.now().hour)
             confidence *= time_multiplier
         
         # Clamp to valid range
-        confidence = max(0.0, min(1.0, confidence))
-        
-        self.logger.debug(
-            "Confidence scored (divergence strategy)",
-            asset=asset,
-            signal_id=signal.signal_id[:8] if signal.signal_id else "N/A",
-            confidence=f"{confidence:.2%}",
-            tier=self.get_confidence_tier(confidence),
-            breakdown={
-                "divergence": f"{divergence_score:.2f}",
-                "pm_staleness": f"{pm_staleness_score:.2f}",
-                "consensus": f"{consensus_score:.2f}",
-                "liquidity": f"{liquidity_score:.2f}",
-                "volume": f"{volume_score:.2f}",
-                "spike": f"{spike_score:.2f}",
-            },
-        )
+        confidence = 0.0 if confidence < 0.0 else (1.0 if confidence > 1.0 else confidence)
+        
+        if self._debug:
+            self.logger.debug(
+                "Confidence scored (divergence strategy)",
+                asset=asset,
+                signal_id=signal.signal_id[:8] if signal.signal_id else "N/A",
+                confidence=f"{confidence:.2%}",
+                tier=self.get_confidence_tier(confidence),
+                breakdown={
+                    "divergence": f"{divergence_score:.2f}",
+                    "pm_staleness": f"{pm_staleness_score:.2f}",
+                    "consensus": f"{consensus_score:.2f}",
+                    "liquidity": f"{liquidity_score:.2f}",
+                    "volume": f"{volume_score:.2f}",
+                    "spike": f"{spike_score:.2f}",
+                },
+            )
         
         return ScoringData(
             confidence=confidence,
@@ -505,13 +568,4 @@ class ConfidenceScorer:
     
     def get_confidence_tier(self, confidence: float) -> str:
         """Get human-readable confidence tier."""
-        if confidence >= 0.85:
-            return "HIGH (★★★★★)"
-        elif confidence >= 0.75:
-            return "GOOD (★★★★☆)"
-        elif confidence >= 0.65:
-            return "MODERATE (★★★☆☆)"
-        elif confidence >= 0.55:
-            return "LOW (★★☆☆☆)"
-        else:
-            return "POOR (★☆☆☆☆)"
+        return _TIERS[bisect_right(_TIER_THRESHOLDS, confidence)]
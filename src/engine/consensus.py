@@ -3,6 +3,7 @@ Consensus Engine for multi-exchange price aggregation.
 Implements weighted averaging with outlier rejection.
 """
 
+import logging
 import math
 import time
 from collections import deque
@@ -10,6 +11,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 from statistics import median
 
+import numpy as np
 import structlog
 
 from src.models.schemas import (
@@ -21,29 +23,48 @@ from config.settings import settings
 
 logger = structlog.get_logger()
 
+# Regime thresholds (p25/p75) move very little per ATR sample, so they are
+# only recomputed after this many new samples
+_REGIME_REFRESH_ADDS = 10
 
-@dataclass
+
+@dataclass(slots=True)
 class ATRHistory:
     """Tracks ATR values for percentile calculation."""
-    values: list[float]
+    values: deque
     max_size: int = 1000
+    total_added: int = field(default=0, init=False)  # Monotonic, survives eviction
+    
+    def __post_init__(self) -> None:
+        # Bounded deque drops the oldest value in O(1) (list.pop(0) was O(n))
+        self.values = deque(self.values, maxlen=self.max_size)
     
     def add(self, atr: float) -> None:
         """Add new ATR value."""
         self.values.append(atr)
-        if len(self.values) > self.max_size:
-            self.values.pop(0)
+        self.total_added += 1
     
     def get_percentile(self, p: float) -> float:
         """Get percentile value (0-100)."""
-        if not self.values:
-            return 0.0
-        sorted_vals = sorted(self.values)
-        idx = int(len(sorted_vals) * p / 100)
-        return sorted_vals[min(idx, len(sorted_vals) - 1)]
+        return self.get_percentiles([p])[0]
+    
+    def get_percentiles(self, ps: list[float]) -> list[float]:
+        """
+        Get several percentile values (0-100) in one pass.
+        
+        Uses np.partition (introselect, O(n)) on the requested ranks
+        instead of fully sorting the history for each percentile.
+        """
+        n = len(self.values)
+        if n == 0:
+            return [0.0] * len(ps)
+        idxs = [min(int(n * p / 100), n - 1) for p in ps]
+        arr = np.fromiter(self.values, dtype=np.float64, count=n)
+        part = np.partition(arr, sorted(set(idxs)))
+        return [float(part[i]) for i in idxs]
 
 
-@dataclass
+@dataclass(slots=True)
 class VolumeZScoreTracker:
     """
     Tracks volume history for Z-score calculation.
@@ -52,10 +73,56 @@ class VolumeZScoreTracker:
     A Z-score > 2.0 indicates statistically significant volume surge.
     """
     history: deque = field(default_factory=lambda: deque(maxlen=300))  # 5 min at 1/sec
+    # Running stats over the window (Welford), so get_zscore is O(1)
+    _mean: float = field(default=0.0, init=False, repr=False)
+    _m2: float = field(default=0.0, init=False, repr=False)
+    _adds_since_resync: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        self._resync()
+    
+    def _resync(self) -> None:
+        """Recompute running stats exactly from the window (bounds float drift)."""
+        n = len(self.history)
+        self._mean = math.fsum(self.history) / n if n else 0.0
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self.history)
+        self._adds_since_resync = 0
+    
+    @property
+    def mean(self) -> float:
+        """Mean volume over the window (0.0 if empty)."""
+        return self._mean
     
     def add(self, volume: float) -> None:
         """Add a volume observation."""
-        self.history.append(volume)
+        history = self.history
+        mean = self._mean
+        m2 = self._m2
+        
+        # Window full: remove the value about to be evicted (reverse Welford)
+        n = len(history)
+        if n == history.maxlen:
+            evicted = history[0]
+            if n > 1:
+                delta = evicted - mean
+                mean -= delta / (n - 1)
+                m2 -= delta * (evicted - mean)
+            else:
+                mean = m2 = 0.0
+        
+        history.append(volume)
+        n = len(history)
+        delta = volume - mean
+        mean += delta / n
+        m2 += delta * (volume - mean)
+        
+        self._mean = mean
+        self._m2 = m2 if m2 > 0.0 else 0.0
+        
+        # Add/remove updates accumulate rounding error; resync once per window
+        self._adds_since_resync += 1
+        if self._adds_since_resync >= (history.maxlen or 1000):
+            self._resync()
     
     def get_zscore(self, current_volume: float) -> float:
         """
@@ -68,19 +135,20 @@ class VolumeZScoreTracker:
         if len(self.history) < 30:  # Need at least 30 samples for reliable stats
             return 0.0
         
-        # Calculate mean and std dev
-        values = list(self.history)
-        mean = sum(values) / len(values)
+        mean = self._mean
         
         if mean == 0:
             return 0.0
         
-        variance = sum((v - mean) ** 2 for v in values) / len(values)
-        std_dev = math.sqrt(variance)
+        n = len(self.history)
+        m2 = self._m2
         
-        if std_dev == 0:
+        # A constant window can leave rounding residue in m2; treat it as zero
+        if m2 <= 1e-12 * n * mean * mean:
             return 0.0
         
+        std_dev = math.sqrt(m2 / n)
+        
         return (current_volume - mean) / std_dev
     
     def get_surge_ratio(self, current_volume: float) -> float:
@@ -113,14 +181,19 @@ class ConsensusEngine:
     
     def __init__(self):
         self.logger = logger.bind(component="consensus")
+        # Per-tick debug events are skipped entirely when filtered out
+        self._debug = self.logger.is_enabled_for(logging.DEBUG)
         
         # Exchange metrics cache
         self._binance_metrics: Optional[ExchangeMetrics] = None
         self._coinbase_metrics: Optional[ExchangeMetrics] = None
         self._kraken_metrics: Optional[ExchangeMetrics] = None
+        self._all_metrics: tuple[ExchangeMetrics, ...] = ()  # Non-None of the above
         
         # Historical ATR for percentile calculation
-        self._atr_history = ATRHistory(values=[])
+        self._atr_history = ATRHistory(values=deque())
+        self._regime_thresholds: Optional[tuple[float, float]] = None  # (p25, p75)
+        self._regime_thresholds_at: int = 0  # total_added when last computed
         
         # Volume tracking - NEW: Z-score based surge detection
         self._volume_zscore_tracker = VolumeZScoreTracker()
@@ -128,6 +201,11 @@ class ConsensusEngine:
         
         # Current consensus
         self._current_consensus: Optional[ConsensusData] = None
+        
+        # Price tolerance is fixed for the engine's lifetime
+        self._tolerance = settings.signals.consensus_price_tolerance
+        self._two_tolerance = 2.0 * self._tolerance
+        self._inv_two_tolerance = 1.0 / self._two_tolerance
     
     def update_exchange(self, exchange: str, metrics: ExchangeMetrics) -> None:
         """Update metrics from an exchange."""
@@ -137,27 +215,27 @@ class ConsensusEngine:
             self._coinbase_metrics = metrics
         elif exchange == "kraken":
             self._kraken_metrics = metrics
+        else:
+            return
+        
+        # Rebuild here so compute_consensus doesn't on every tick
+        self._all_metrics = tuple(
+            m for m in (self._binance_metrics, self._coinbase_metrics, self._kraken_metrics)
+            if m is not None
+        )
     
-    def _get_all_metrics(self) -> list[ExchangeMetrics]:
-        """Get list of all non-None exchange metrics."""
-        metrics = []
-        if self._binance_metrics:
-            metrics.append(self._binance_metrics)
-        if self._coinbase_metrics:
-            metrics.append(self._coinbase_metrics)
-        if self._kraken_metrics:
-            metrics.append(self._kraken_metrics)
-        return metrics
+    def _get_all_metrics(self) -> tuple[ExchangeMetrics, ...]:
+        """Get all non-None exchange metrics."""
+        return self._all_metrics
     
-    def _check_staleness(self, metrics: list[ExchangeMetrics]) -> list[ExchangeMetrics]:
-        """Filter out stale metrics (>10s old)."""
-        now_ms = int(time.time() * 1000)
+    def _check_staleness(self, metrics: tuple[ExchangeMetrics, ...], now_ms: int) -> list[ExchangeMetrics]:
+        """Filter out stale metrics (>10s old) relative to now_ms."""
         fresh = []
         for m in metrics:
             age_ms = now_ms - m.local_timestamp_ms
             if age_ms < 10000:  # 10 seconds - more reasonable threshold
                 fresh.append(m)
-            else:
+            elif self._debug:
                 self.logger.debug(  # Changed to debug to reduce noise
                     "Stale exchange data",
                     exchange=m.exchange,
@@ -169,22 +247,39 @@ class ConsensusEngine:
         """Calculate max deviation and average price."""
         if not prices:
             return 0.0, 0.0
-        avg = sum(prices) / len(prices)
-        max_dev = max(abs(p - avg) / avg for p in prices)
+        # One pass for sum/min/max; max |p - avg| is at one of the extremes
+        total = pmin = pmax = prices[0]
+        for p in prices[1:]:
+            total += p
+            if p < pmin:
+                pmin = p
+            elif p > pmax:
+                pmax = p
+        avg = total / len(prices)
+        max_dev = max(avg - pmin, pmax - avg) / avg
         return max_dev, avg
     
-    def _weighted_average(self, metrics: list[ExchangeMetrics]) -> float:
+    def _weighted_average(self, prices: list[float], volumes: list[float]) -> float:
         """Calculate volume-weighted average price."""
-        total_volume = sum(m.volume_1m for m in metrics)
+        # Single pass; the plain price sum is only used if there's no volume
+        weighted_sum = total_volume = price_sum = 0.0
+        for p, v in zip(prices, volumes):
+            weighted_sum += p * v
+            total_volume += v
+            price_sum += p
         if total_volume == 0:
-            return sum(m.current_price for m in metrics) / len(metrics)
+            return price_sum / len(prices)
         
-        weighted_sum = sum(m.current_price * m.volume_1m for m in metrics)
         return weighted_sum / total_volume
     
-    def _median_price(self, metrics: list[ExchangeMetrics]) -> float:
+    def _median_price(self, prices: list[float]) -> float:
         """Calculate median price."""
-        prices = [m.current_price for m in metrics]
+        # Only 2-3 exchanges in practice: skip statistics.median's sort
+        if len(prices) == 3:
+            a, b, c = prices
+            return max(min(a, b), min(max(a, b), c))
+        if len(prices) == 2:
+            return 0.5 * (prices[0] + prices[1])
         return median(prices)
     
     def _identify_outlier(self, metrics: list[ExchangeMetrics]) -> Optional[str]:
@@ -192,15 +287,23 @@ class ConsensusEngine:
         if len(metrics) < 3:
             return None
         
-        prices = [m.current_price for m in metrics]
-        avg = sum(prices) / len(prices)
+        avg = sum(m.current_price for m in metrics) / len(metrics)
         
-        deviations = [(m.exchange, abs(m.current_price - avg) / avg) for m in metrics]
-        deviations.sort(key=lambda x: x[1], reverse=True)
+        # Track the largest and second-largest deviation in one pass
+        top_exchange: Optional[str] = None
+        top_dev = second_dev = -1.0
+        for m in metrics:
+            dev = abs(m.current_price - avg) / avg
+            if dev > top_dev:
+                second_dev = top_dev
+                top_dev = dev
+                top_exchange = m.exchange
+            elif dev > second_dev:
+                second_dev = dev
         
         # If top deviation is significantly larger than others
-        if deviations[0][1] > 0.0015 and deviations[0][1] > 2 * deviations[1][1]:
-            return deviations[0][0]
+        if top_dev > 0.0015 and top_dev > 2 * second_dev:
+            return top_exchange
         
         return None
     
@@ -217,8 +320,16 @@ class ConsensusEngine:
         if not self._atr_history.values:
             return VolatilityRegime.NORMAL
         
-        p25 = self._atr_history.get_percentile(25)
-        p75 = self._atr_history.get_percentile(75)
+        history = self._atr_history
+        if (
+            self._regime_thresholds is None
+            or history.total_added - self._regime_thresholds_at >= _REGIME_REFRESH_ADDS
+        ):
+            p25, p75 = history.get_percentiles([25, 75])
+            self._regime_thresholds = (p25, p75)
+            self._regime_thresholds_at = history.total_added
+        else:
+            p25, p75 = self._regime_thresholds
         
         if atr < p25:
             return VolatilityRegime.LOW
@@ -232,44 +343,65 @@ class ConsensusEngine:
         Compute consensus from all exchange data.
         Returns None if consensus cannot be formed.
         """
+        # Single clock read per tick (staleness, volume gate, timestamp)
+        now_ms = int(time.time() * 1000)
+        
         all_metrics = self._get_all_metrics()
         
         if len(all_metrics) < 2:
-            self.logger.debug("Insufficient exchanges for consensus", count=len(all_metrics))
+            if self._debug:
+                self.logger.debug("Insufficient exchanges for consensus", count=len(all_metrics))
             return None
         
         # Filter stale data
-        fresh_metrics = self._check_staleness(all_metrics)
+        fresh_metrics = self._check_staleness(all_metrics, now_ms)
         if len(fresh_metrics) < 2:
-            self.logger.debug("Too many stale exchanges, waiting for fresh data")
+            if self._debug:
+                self.logger.debug("Too many stale exchanges, waiting for fresh data")
             return None
         
+        # Read each field once (the dataclass attribute reads add up per tick)
+        # and accumulate the aggregate metrics in the same pass
+        prices: list[float] = []
+        volumes: list[float] = []
+        move_sum = volatility_sum = atr_sum = 0.0
+        max_10s_move = -math.inf
+        for m in fresh_metrics:
+            prices.append(m.current_price)
+            volumes.append(m.volume_1m)
+            move_sum += m.move_30s_pct
+            volatility_sum += m.volatility_30s
+            atr_sum += m.atr_5m
+            move_10s = m.max_move_10s_pct
+            if move_10s > max_10s_move:
+                max_10s_move = move_10s
+        n = len(prices)
+        
         # Calculate price deviation
-        prices = [m.current_price for m in fresh_metrics]
         max_deviation, avg_price = self._calculate_deviation(prices)
         
         # Determine consensus price
-        tolerance = settings.signals.consensus_price_tolerance
+        tolerance = self._tolerance
         
         # Calculate agreement_score (1.0 = perfect agreement, decreases with deviation)
         # At tolerance level, agreement_score = 0.85
         # At 2x tolerance, agreement_score ≈ 0.70
         if max_deviation > 0:
-            agreement_score = 1.0 - (max_deviation / (2 * tolerance))
-            agreement_score = max(0.0, min(1.0, agreement_score))
+            agreement_score = 1.0 - max_deviation * self._inv_two_tolerance
+            agreement_score = 0.0 if agreement_score < 0.0 else (1.0 if agreement_score > 1.0 else agreement_score)
         else:
             agreement_score = 1.0
         
         if max_deviation <= tolerance:
             # All prices agree - use weighted average
-            consensus_price = self._weighted_average(fresh_metrics)
+            consensus_price = self._weighted_average(prices, volumes)
             agreement = True
-        elif max_deviation <= 2 * tolerance and len(fresh_metrics) >= 3:
+        elif max_deviation <= self._two_tolerance and n >= 3:
             # One outlier - use median
             outlier = self._identify_outlier(fresh_metrics)
             if outlier:
                 self.logger.info("Using median due to outlier", outlier=outlier)
-            consensus_price = self._median_price(fresh_metrics)
+            consensus_price = self._median_price(prices)
             agreement = True
         else:
             # Too much disagreement
@@ -282,10 +414,9 @@ class ConsensusEngine:
             return None
         
         # Aggregate metrics
-        move_30s = sum(m.move_30s_pct for m in fresh_metrics) / len(fresh_metrics)
-        volatility_30s = sum(m.volatility_30s for m in fresh_metrics) / len(fresh_metrics)
-        atr_5m = sum(m.atr_5m for m in fresh_metrics) / len(fresh_metrics)
-        max_10s_move = max(m.max_move_10s_pct for m in fresh_metrics)
+        move_30s = move_sum / n
+        volatility_30s = volatility_sum / n
+        atr_5m = atr_sum / n
         
         # Update ATR history
         if atr_5m > 0:
@@ -295,10 +426,9 @@ class ConsensusEngine:
         spike_concentration = max_10s_move / abs(move_30s) if move_30s != 0 else 0.0
         
         # Volume metrics - FIXED: Use Z-score for proper surge detection
-        total_volume = sum(m.volume_1m for m in fresh_metrics)
+        total_volume = sum(volumes)
         
         # Update Z-score tracker (once per second max)
-        now_ms = int(time.time() * 1000)
         if now_ms - self._last_volume_update_ms >= 1000:
             self._volume_zscore_tracker.add(total_volume)
             self._last_volume_update_ms = now_ms
@@ -308,13 +438,11 @@ class ConsensusEngine:
         volume_surge = self._volume_zscore_tracker.get_surge_ratio(total_volume)
         
         # Get average volume for reporting
-        avg_volume_5m = sum(self._volume_zscore_tracker.history) / max(len(self._volume_zscore_tracker.history), 1)
+        avg_volume_5m = self._volume_zscore_tracker.mean
         
         # Determine volatility regime
         vol_regime = self._determine_volatility_regime(atr_5m)
         
-        now_ms = int(time.time() * 1000)
-        
         consensus = ConsensusData(
             consensus_price=consensus_price,
             consensus_timestamp_ms=now_ms,
@@ -333,7 +461,7 @@ class ConsensusEngine:
             agreement=agreement,
             max_deviation_pct=max_deviation,
             agreement_score=agreement_score,
-            exchange_count=len(fresh_metrics),
+            exchange_count=n,
         )
         
         self._current_consensus = consensus
@@ -11,6 +11,7 @@ Enhanced features:
 """
 
 import asyncio
+import heapq
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -36,6 +37,9 @@ if TYPE_CHECKING:
 
 logger = structlog.get_logger()
 
+# Polygon produces a block every ~2s, so a 1s-old base fee is still current
+_GAS_PRICE_TTL_S = 1.0
+
 
 class OrderStatus(str, Enum):
     """Order status tracking."""
@@ -68,22 +72,48 @@ class Position:
     partial_exit_done: bool = False  # Track if partial exit was taken
     partial_exit_size: float = 0.0   # Size exited in partial
     remaining_size: float = 0.0      # Remaining position size
+    # Derived: take-profit multiplier from entry mispricing (fixed for the position's life)
+    mispricing_tp_mult: float = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        # High initial mispricing (>5%) raises TP by 25% (capped in adaptive TP)
+        self.mispricing_tp_mult = 1.25 if self.initial_mispricing > 0.05 else 1.0
 
 
 @dataclass
 class NonceTracker:
-    """Track nonces to prevent collisions."""
+    """
+    Track nonces to prevent collisions.
+    
+    Hands out the lowest nonce >= max(chain, confirmed) that isn't pending.
+    Fresh nonces come from a monotonic counter; released ones below it are
+    kept in a min-heap of holes and reused first. A chain nonce above the
+    counter moves it forward for good (the chain already counts the nonces
+    skipped), until resync().
+    """
     confirmed_nonce: int = 0
     pending_nonces: set = field(default_factory=set)
+    next_nonce: int = 0  # Counter: every nonce below it was handed out
+    holes: list[int] = field(default_factory=list)  # Released, below next_nonce (heap)
     
     def get_next(self, chain_nonce: int) -> int:
         """Get next safe nonce."""
         # Start from chain nonce
-        nonce = max(chain_nonce, self.confirmed_nonce)
+        floor = max(chain_nonce, self.confirmed_nonce)
         
-        # Skip any pending nonces
-        while nonce in self.pending_nonces:
-            nonce += 1
+        # Holes below the floor can no longer be used
+        holes = self.holes
+        while holes and holes[0] < floor:
+            heapq.heappop(holes)
+        
+        if holes:
+            nonce = heapq.heappop(holes)
+        else:
+            nonce = max(self.next_nonce, floor)
+            # Only loops after resync() moved the counter back under pending nonces
+            while nonce in self.pending_nonces:
+                nonce += 1
+            self.next_nonce = nonce + 1
         
         self.pending_nonces.add(nonce)
         return nonce
@@ -95,7 +125,17 @@ class NonceTracker:
     
     def release(self, nonce: int) -> None:
         """Release a nonce that wasn't used."""
-        self.pending_nonces.discard(nonce)
+        if nonce in self.pending_nonces:
+            self.pending_nonces.discard(nonce)
+            # At or above the counter it will be handed out again anyway
+            if nonce < self.next_nonce:
+                heapq.heappush(self.holes, nonce)
+    
+    def resync(self, chain_nonce: int) -> None:
+        """Reset to the chain's pending nonce (after a nonce error)."""
+        self.confirmed_nonce = chain_nonce
+        self.next_nonce = chain_nonce
+        self.holes.clear()
 
 
 class ExecutionEngine:
@@ -144,6 +184,11 @@ class ExecutionEngine:
         # Nonce tracking
         self._nonce_tracker = NonceTracker()
         
+        # Gas price cache: (max_fee, priority_fee), shared by concurrent signals
+        self._gas_cache: Optional[tuple[int, int]] = None
+        self._gas_cache_ts: float = 0.0
+        self._gas_lock = asyncio.Lock()
+        
         # Active positions
         self._positions: dict[str, Position] = {}
         
@@ -203,6 +248,17 @@ class ExecutionEngine:
     
     async def _get_gas_price(self) -> tuple[int, int]:
         """Get current gas prices (maxFeePerGas, maxPriorityFeePerGas)."""
+        if self._gas_cache and time.monotonic() - self._gas_cache_ts < _GAS_PRICE_TTL_S:
+            return self._gas_cache
+        
+        async with self._gas_lock:
+            # Another caller may have refreshed while we waited
+            if self._gas_cache and time.monotonic() - self._gas_cache_ts < _GAS_PRICE_TTL_S:
+                return self._gas_cache
+            return await self._fetch_gas_price()
+    
+    async def _fetch_gas_price(self) -> tuple[int, int]:
+        """Fetch gas prices from the latest block and refresh the cache."""
         try:
             # Get base fee from latest block
             block = await self._w3.eth.get_block("latest")
@@ -210,17 +266,19 @@ class ExecutionEngine:
             
             # Priority fee
             priority_fee = min(
-                settings.execution.max_priority_fee_gwei * 10**9,
+                settings.execution.max_priority_fee_wei,
                 35 * 10**9,
             )
             
             # Max fee = 2 * base fee + priority
             max_fee = min(
                 2 * base_fee + priority_fee,
-                settings.execution.max_fee_per_gas_gwei * 10**9,
+                settings.execution.max_fee_per_gas_wei,
             )
             
-            return max_fee, priority_fee
+            self._gas_cache = (max_fee, priority_fee)
+            self._gas_cache_ts = time.monotonic()
+            return self._gas_cache
             
         except Exception as e:
             self.logger.error("Failed to get gas price", error=str(e))
@@ -377,8 +435,7 @@ class ExecutionEngine:
         if mode == "night_auto":
             position_size = settings.risk.night_mode_max_position_eur
         else:
-            bankroll = settings.risk.starting_capital_eur
-            position_size = bankroll * settings.risk.max_position_pct
+            position_size = settings.risk.max_position_eur
         
         # Get entry price (best bid for YES buys)
         if not signal.polymarket:
@@ -456,14 +513,12 @@ class ExecutionEngine:
     ) -> ActionData:
         """Execute actual trade on-chain with enhanced position tracking."""
         start_time = time.time()
+        nonce: Optional[int] = None
         
         try:
-            # Get nonce
-            chain_nonce = await self._w3.eth.get_transaction_count(
-                self.wallet_address,
-                "pending"
-            )
-            nonce = self._nonce_tracker.get_next(chain_nonce)
+            # Get nonce from the local tracker (seeded in initialize());
+            # the chain is only re-read after a nonce error
+            nonce = self._nonce_tracker.get_next(self._nonce_tracker.confirmed_nonce)
             
             # Calculate initial mispricing for adaptive exit logic
             initial_mispricing = 0.0
@@ -542,11 +597,28 @@ class ExecutionEngine:
         except Exception as e:
             self.logger.error("Trade execution failed", error=str(e))
             self._consecutive_failed_fills += 1
+            if nonce is not None:
+                self._nonce_tracker.release(nonce)
+            error = str(e).lower()
+            if "nonce too low" in error or "already known" in error:
+                await self._resync_nonce()
             return ActionData(
                 mode="night_auto",
                 decision=ActionDecision.REJECT,
             )
     
+    async def _resync_nonce(self) -> None:
+        """Re-seed the nonce tracker from the chain after a nonce error."""
+        try:
+            chain_nonce = await self._w3.eth.get_transaction_count(
+                self.wallet_address,
+                "pending"
+            )
+            self._nonce_tracker.resync(chain_nonce)
+            self.logger.warning("Nonce resynced from chain", nonce=chain_nonce)
+        except Exception as e:
+            self.logger.error("Failed to resync nonce", error=str(e))
+    
     def _calculate_adaptive_take_profit(
         self,
         position: Position,
@@ -564,18 +636,13 @@ class ExecutionEngine:
         Lower TP when oracle is stale (exit faster)
         Raise TP when initial mispricing was high (more potential)
         """
-        # Use asset-specific base TP
-        base_tp = asset_params["take_profit_pct"]
-        
-        # If oracle is very stale (>50s), lower TP to exit faster
-        if current_oracle_age > 50:
-            base_tp *= 0.8  # Reduce by 20%
+        # Asset-specific base TP, reduced by 20% if oracle is very stale (>50s),
+        # times the entry-mispricing multiplier precomputed on the position
+        mult = position.mispricing_tp_mult
+        tp = asset_params["take_profit_pct"] * (0.8 if current_oracle_age > 50 else 1.0) * mult
         
-        # If initial mispricing was high (>5%), raise TP (but cap at 12%)
-        if position.initial_mispricing > 0.05:
-            base_tp = min(0.12, base_tp * 1.25)  # Increase by 25%, cap at 12%
-        
-        return base_tp
+        # A raised TP is capped at 12%
+        return min(0.12, tp) if mult > 1.0 else tp
     
     async def manage_position(
         self,
@@ -724,6 +791,45 @@ class ExecutionEngine:
         
         return None
     
+    async def manage_positions_batch(
+        self,
+        ticks: dict[str, tuple[float, float]],
+        oracle_age: Optional[float] = None,
+    ) -> list[Optional[OutcomeData]]:
+        """
+        Run manage_position for several positions concurrently.
+        
+        Args:
+            ticks: signal_id -> (current_price, spread)
+            oracle_age: Current oracle age in seconds (fetched once if not provided)
+        
+        Returns:
+            One entry per tick, in order: OutcomeData if that position was
+            closed, None otherwise (including if its management failed)
+        """
+        # One oracle read for the whole batch instead of one per position
+        if oracle_age is None and self._chainlink_feed:
+            oracle_data = self._chainlink_feed.get_data()
+            oracle_age = oracle_data.oracle_age_seconds if oracle_data else 0.0
+        
+        signal_ids = list(ticks)
+        results = await asyncio.gather(
+            *(
+                self.manage_position(signal_id, price, spread, oracle_age)
+                for signal_id, (price, spread) in ticks.items()
+            ),
+            return_exceptions=True,
+        )
+        
+        outcomes: list[Optional[OutcomeData]] = []
+        for signal_id, result in zip(signal_ids, results):
+            if isinstance(result, BaseException):
+                self.logger.error("Position management failed", signal_id=signal_id, error=str(result))
+                outcomes.append(None)
+            else:
+                outcomes.append(result)
+        return outcomes
+    
     async def _partial_exit(
         self,
         position: Position,
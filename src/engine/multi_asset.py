@@ -43,12 +43,8 @@ class MultiAssetManager:
     def __init__(self):
         self.logger = logger.bind(component="multi_asset_manager")
         
-        # Parse assets from settings
-        self.assets: List[str] = [
-            a.strip().upper() 
-            for a in settings.assets.split(",") 
-            if a.strip()
-        ]
+        # Assets from settings
+        self.assets: List[str] = list(settings.asset_list)
         
         # Asset feeds and engines
         self.asset_feeds: Dict[str, AssetFeeds] = {}
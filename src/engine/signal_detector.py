@@ -58,9 +58,10 @@ def calculate_spot_implied_prob(momentum_velocity: float, scale: float = 100.0)
         - +0.5% move → ~65% probability (vs ~62% at scale=100)
         - +0.7% move → ~71% probability (vs ~67% at scale=100)
     """
-    # Logistic function: 1 / (1 + e^(-x))
-    # momentum_velocity is in decimal form (0.01 = 1%)
-    return 1 / (1 + math.exp(-momentum_velocity * scale))
+    # Logistic function: 1 / (1 + e^(-x)) == 0.5 * (1 + tanh(x / 2))
+    # momentum_velocity is in decimal form (0.01 = 1%); the tanh form saturates
+    # at 0/1 for extreme inputs where exp() would raise OverflowError
+    return 0.5 * (1.0 + math.tanh(0.5 * momentum_velocity * scale))
 
 
 def calculate_window_implied_prob(
@@ -179,6 +180,7 @@ class SignalDetector:
         """
         # Get asset-specific settings
         asset_config = settings.asset_configs.get(asset)
+        signals = settings.signals
         
         # =======================================================================
         # NEW: Window-aware probability calculation
@@ -219,7 +221,7 @@ class SignalDetector:
             spot_move = consensus.move_30s_pct
             
             # Asset-specific sigmoid scale (ETH=130 for sensitivity, others=100)
-            scale = asset_config.spot_implied_scale or settings.signals.spot_implied_scale
+            scale = asset_config.spot_implied_scale or signals.spot_implied_scale
             
             # Apply volatility scaling for ETH during calm periods
             effective_spot_move = spot_move
@@ -271,7 +273,7 @@ class SignalDetector:
         HIGH_DIV_OVERRIDE_PCT = 0.30  # 30% divergence bypasses staleness check
         
         # Use asset-specific min divergence
-        min_div = asset_config.min_divergence_pct or settings.signals.min_divergence_pct
+        min_div = asset_config.min_divergence_pct or signals.min_divergence_pct
         
         if divergence >= HIGH_DIV_OVERRIDE_PCT:
             # High divergence = always actionable (staleness doesn't matter)
@@ -280,7 +282,7 @@ class SignalDetector:
             # Normal case: need divergence AND fresh-ish PM data
             is_actionable = (
                 divergence >= min_div and
-                pm_age <= settings.signals.max_pm_staleness_seconds
+                pm_age <= signals.max_pm_staleness_seconds
             )
         
         return DivergenceData(
@@ -291,7 +293,7 @@ class SignalDetector:
             signal_direction=direction,
             is_actionable=is_actionable,
             min_divergence=min_div,
-            min_pm_age=settings.signals.min_pm_staleness_seconds,
+            min_pm_age=signals.min_pm_staleness_seconds,
         )
     
     # ==========================================================================
@@ -366,6 +368,8 @@ class SignalDetector:
         
         OVERRIDE: If divergence is extremely high (>30%), bypass most filters.
         """
+        signals = settings.signals
+        
         # HIGH DIVERGENCE OVERRIDE: Skip most filters if divergence is massive
         HIGH_DIV_OVERRIDE_THRESHOLD = 0.30  # 30% divergence = definitely trade
         if divergence_data.divergence >= HIGH_DIV_OVERRIDE_THRESHOLD:
@@ -382,7 +386,7 @@ class SignalDetector:
             return True, None
         
         # Volume surge - confirms move is real
-        if consensus.volume_surge_ratio < settings.signals.volume_surge_threshold:
+        if consensus.volume_surge_ratio < signals.volume_surge_threshold:
             self._track_rejection(
                 "volume_low", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
                 divergence_data.signal_direction, consensus, pm_data
@@ -390,13 +394,13 @@ class SignalDetector:
             self.logger.info(
                 "❌ Rejected: Volume surge insufficient",
                 volume_surge=f"{consensus.volume_surge_ratio:.2f}x",
-                required=f"{settings.signals.volume_surge_threshold:.2f}x",
+                required=f"{signals.volume_surge_threshold:.2f}x",
                 divergence=f"{divergence_data.divergence:.1%}",
             )
             return False, RejectionReason.VOLUME_LOW
         
         # Spike concentration - rejects smooth drift
-        if consensus.spike_concentration < settings.signals.spike_concentration_threshold:
+        if consensus.spike_concentration < signals.spike_concentration_threshold:
             self._track_rejection(
                 "smooth_drift", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
                 divergence_data.signal_direction, consensus, pm_data
@@ -404,7 +408,7 @@ class SignalDetector:
             self.logger.info(
                 "❌ Rejected: Smooth drift (not a spike)",
                 spike_concentration=f"{consensus.spike_concentration:.1%}",
-                required=f"{settings.signals.spike_concentration_threshold:.1%}",
+                required=f"{signals.spike_concentration_threshold:.1%}",
                 divergence=f"{divergence_data.divergence:.1%}",
             )
             return False, RejectionReason.SMOOTH_DRIFT
@@ -418,7 +422,7 @@ class SignalDetector:
             self.logger.info("❌ Rejected: No exchange consensus")
             return False, RejectionReason.CONSENSUS_FAILURE
         
-        if consensus.agreement_score < settings.signals.min_agreement_score:
+        if consensus.agreement_score < signals.min_agreement_score:
             self._track_rejection(
                 "poor_agreement", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
                 divergence_data.signal_direction, consensus, pm_data
@@ -426,12 +430,12 @@ class SignalDetector:
             self.logger.info(
                 "❌ Rejected: Poor exchange agreement",
                 agreement_score=f"{consensus.agreement_score:.1%}",
-                required=f"{settings.signals.min_agreement_score:.1%}",
+                required=f"{signals.min_agreement_score:.1%}",
             )
             return False, RejectionReason.CONSENSUS_FAILURE
         
         # Volatility check
-        if consensus.volatility_30s > settings.signals.max_volatility_30s:
+        if consensus.volatility_30s > signals.max_volatility_30s:
             self._track_rejection(
                 "volatility_high", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
                 divergence_data.signal_direction, consensus, pm_data
@@ -439,13 +443,13 @@ class SignalDetector:
             self.logger.info(
                 "❌ Rejected: Volatility too high",
                 volatility=f"{consensus.volatility_30s:.3%}",
-                max_allowed=f"{settings.signals.max_volatility_30s:.3%}",
+                max_allowed=f"{signals.max_volatility_30s:.3%}",
             )
             return False, RejectionReason.VOLATILITY_TOO_HIGH
         
         # Liquidity check - uses asset-specific minimum if available
         asset_config = settings.asset_configs.get(asset)
-        min_liq = asset_config.min_liquidity_eur or settings.signals.min_liquidity_eur
+        min_liq = asset_config.min_liquidity_eur or signals.min_liquidity_eur
         
         if pm_data.yes_liquidity_best < min_liq:
             self._track_rejection(
@@ -469,7 +473,7 @@ class SignalDetector:
             return False, RejectionReason.LIQUIDITY_COLLAPSING
         
         # Minimum spot move (prevents noise signals)
-        if abs(consensus.move_30s_pct) < settings.signals.min_spot_move_pct:
+        if abs(consensus.move_30s_pct) < signals.min_spot_move_pct:
             self._track_rejection(
                 "insufficient_move", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
                 divergence_data.signal_direction, consensus, pm_data
@@ -477,7 +481,7 @@ class SignalDetector:
             self.logger.info(
                 "❌ Rejected: Spot move too small",
                 spot_move=f"{consensus.move_30s_pct:.2%}",
-                required=f"{settings.signals.min_spot_move_pct:.2%}",
+                required=f"{signals.min_spot_move_pct:.2%}",
             )
             return False, RejectionReason.INSUFFICIENT_MOVE
         
@@ -563,8 +567,9 @@ class SignalDetector:
         """
         # Get asset-specific settings (fall back to global defaults)
         asset_config = settings.asset_configs.get(asset)
-        min_liquidity = asset_config.min_liquidity_eur or settings.signals.min_liquidity_eur
-        min_divergence = asset_config.min_divergence_pct or settings.signals.min_divergence_pct
+        signals = settings.signals
+        min_liquidity = asset_config.min_liquidity_eur or signals.min_liquidity_eur
+        min_divergence = asset_config.min_divergence_pct or signals.min_divergence_pct
         min_price = asset_config.min_price or 0.05
         max_price = asset_config.max_price or 0.95
         # EARLY CHECK: Reject if PM data is empty/invalid
@@ -630,11 +635,11 @@ class SignalDetector:
         # Primary check: Is divergence actionable? (use asset-specific threshold)
         is_actionable = (
             divergence_data.divergence >= min_divergence and
-            divergence_data.pm_orderbook_age_seconds <= settings.signals.max_pm_staleness_seconds
+            divergence_data.pm_orderbook_age_seconds <= signals.max_pm_staleness_seconds
         )
         
         # Override: High divergence (>30%) always actionable
-        if divergence_data.divergence >= settings.signals.high_divergence_override_pct:
+        if divergence_data.divergence >= signals.high_divergence_override_pct:
             is_actionable = True
         
         if not is_actionable:
@@ -653,7 +658,7 @@ class SignalDetector:
                         required=f"{min_divergence:.1%}",
                         direction=divergence_data.signal_direction,
                     )
-            elif divergence_data.pm_orderbook_age_seconds > settings.signals.max_pm_staleness_seconds:
+            elif divergence_data.pm_orderbook_age_seconds > signals.max_pm_staleness_seconds:
                 # CORRECTED: Only reject if TOO STALE (fresh data is GOOD!)
                 self._track_rejection(
                     "pm_too_stale", divergence_data.divergence, divergence_data.pm_orderbook_age_seconds,
@@ -662,7 +667,7 @@ class SignalDetector:
                 self.logger.info(
                     "⏸️ PM too stale (opportunity may have passed)",
                     pm_age=f"{divergence_data.pm_orderbook_age_seconds:.0f}s",
-                    max_allowed=f"{settings.signals.max_pm_staleness_seconds:.0f}s",
+                    max_allowed=f"{signals.max_pm_staleness_seconds:.0f}s",
                     divergence=f"{divergence_data.divergence:.1%}",
                 )
             return None
@@ -100,6 +100,8 @@ class Validator:
         UPDATED: For divergence strategy, we check divergence magnitude
         not spot movement. Divergence IS the signal!
         """
+        signals = settings.signals
+        
         if not signal.consensus:
             return False, RejectionReason.CONSENSUS_FAILURE
         
@@ -110,18 +112,18 @@ class Validator:
             
             spot_implied = calculate_spot_implied_prob(
                 signal.consensus.move_30s_pct,
-                scale=settings.signals.spot_implied_scale,
+                scale=signals.spot_implied_scale,
             )
             pm_implied = signal.polymarket.yes_bid
             divergence = abs(spot_implied - pm_implied)
             
             # If divergence is significant, pass the check
-            if divergence >= settings.signals.min_divergence_pct:
+            if divergence >= signals.min_divergence_pct:
                 return True, None
         
         # Fallback: Legacy spot movement check
         overall_move = signal.consensus.move_30s_pct
-        if abs(overall_move) >= settings.signals.escape_clause_min_move * 0.5:
+        if abs(overall_move) >= signals.min_persistence_move:
             return True, None
         
         # Only reject if BOTH divergence AND movement are tiny
@@ -220,7 +222,7 @@ class Validator:
         regime = signal.consensus.volatility_regime
         
         # Get appropriate age window
-        if regime == VolatilityRegime.LOW:
+        if regime is VolatilityRegime.LOW:
             min_age = settings.chainlink.oracle_min_age_low_vol
         else:
             min_age = settings.chainlink.oracle_min_age_normal_vol
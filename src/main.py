@@ -35,7 +35,7 @@ import structlog
 #     print("⚠️ uvloop not available - using standard asyncio")
 print("ℹ️ Using standard asyncio")
 
-from config.settings import settings, OperatingMode
+from config.settings import settings, SHADOW, ALERT, NIGHT_AUTO
 from src.feeds.binance import BinanceFeed
 from src.feeds.coinbase import CoinbaseFeed
 from src.feeds.kraken import KrakenFeed
@@ -81,8 +81,8 @@ class TradingBot:
         self.metrics_logger = MetricsLogger()
         self.performance = PerformanceTracker()
         
-        # Parse configured assets
-        self.assets = [a.strip().upper() for a in settings.assets.split(",") if a.strip()]
+        # Configured assets
+        self.assets = list(settings.asset_list)
         self.logger.info("Configured assets", assets=self.assets)
         
         # Multi-asset manager (handles feeds for all assets)
@@ -224,11 +224,11 @@ class TradingBot:
     
     def _initialize_mode(self) -> None:
         """Initialize operating mode based on settings."""
-        if settings.mode == OperatingMode.SHADOW:
+        if settings.mode == SHADOW:
             self.mode = ShadowMode()
             self.logger.info("Initialized SHADOW mode")
         
-        elif settings.mode == OperatingMode.ALERT:
+        elif settings.mode == ALERT:
             # Initialize AlertMode with feed references for virtual trading
             self.logger.info(
                 "Initializing ALERT mode",
@@ -245,7 +245,7 @@ class TradingBot:
                 virtual_trader_active=self.mode._virtual_trader is not None,
             )
         
-        elif settings.mode == OperatingMode.NIGHT_AUTO:
+        elif settings.mode == NIGHT_AUTO:
             if not self.execution_engine:
                 self.logger.error("Night auto mode requires execution engine")
                 self.mode = ShadowMode()  # Fallback to shadow
@@ -687,7 +687,7 @@ class TradingBot:
         """Start the trading bot."""
         self.logger.info(
             "Starting Polymarket Oracle-Lag Trading Bot",
-            mode=settings.mode.value,
+            mode=settings.mode,
             assets=self.assets,
         )
         
@@ -726,7 +726,7 @@ class TradingBot:
         # Send startup notification
         if self.alerter:
             assets_str = ", ".join(self.assets)
-            mode_name = settings.mode.value.upper()
+            mode_name = settings.mode.upper()
             
             # Build mode-specific status
             if isinstance(self.mode, AlertMode):
@@ -210,13 +210,18 @@ class MakerOrderExecutor:
             
             # Build and send approval transaction
             nonce = w3.eth.get_transaction_count(account.address)
-            gas_price = w3.eth.gas_price
+            
+            # EIP-1559 (type-2) fees, capped like ExecutionEngine._get_gas_price
+            base_fee = w3.eth.get_block("latest").get("baseFeePerGas", 30_000_000_000)
+            priority_fee = min(settings.execution.max_priority_fee_wei, 35 * 10**9)
+            max_fee = min(2 * base_fee + priority_fee, settings.execution.max_fee_per_gas_wei)
             
             tx = ct_contract.functions.setApprovalForAll(EXCHANGE, True).build_transaction({
                 'from': account.address,
                 'nonce': nonce,
                 'gas': 100000,
-                'gasPrice': gas_price,
+                'maxFeePerGas': max_fee,
+                'maxPriorityFeePerGas': priority_fee,
             })
             
             signed = account.sign_transaction(tx)
@@ -224,7 +229,8 @@ class MakerOrderExecutor:
             self.logger.info(f"Approval transaction sent: {tx_hash.hex()}")
             
             # Wait for confirmation
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+            # Poll once per Polygon block (~2s) rather than web3's 0.1s default
+            receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60, poll_latency=2.0)
             
             if receipt['status'] == 1:
                 self.logger.info("✅ Exchange approved for conditional tokens!")
@@ -0,0 +1,64 @@
+"""Tests for the confidence scorer."""
+
+import pytest
+from src.engine.confidence import ConfidenceScorer
+from src.models.schemas import (
+    ConsensusData,
+    PolymarketData,
+    SignalCandidate,
+    SignalDirection,
+)
+
+
+@pytest.fixture
+def scorer():
+    """Create a confidence scorer without a time-of-day analyzer."""
+    return ConfidenceScorer()
+
+
+def make_signal(direction: SignalDirection, obi_ratio: float) -> SignalCandidate:
+    """Build a signal whose only varying input is the orderbook imbalance."""
+    return SignalCandidate(
+        direction=direction,
+        consensus=ConsensusData(
+            consensus_price=50000.0,
+            consensus_timestamp_ms=1700000000000,
+            move_30s_pct=0.002,
+            agreement_score=0.9,
+        ),
+        polymarket=PolymarketData(
+            market_id="test",
+            timestamp_ms=1700000000000,
+            yes_bid=0.50,
+            yes_ask=0.52,
+            yes_liquidity_best=100.0,
+            no_bid=0.50,
+            no_ask=0.52,
+            no_liquidity_best=100.0,
+            orderbook_imbalance_ratio=obi_ratio,
+        ),
+    )
+
+
+class TestObiBonus:
+    """Tests for the order book imbalance bonus applied in score()."""
+
+    @pytest.mark.parametrize("direction, confirming, opposing", [
+        (SignalDirection.UP, 0.9, -0.9),
+        (SignalDirection.DOWN, -0.9, 0.9),
+    ])
+    def test_bonus_only_when_imbalance_confirms_direction(
+        self, scorer, direction, confirming, opposing
+    ):
+        """Test that OBI adds confidence only on the side matching the signal."""
+        neutral = scorer.score(make_signal(direction, 0.0)).confidence
+
+        boosted = scorer.score(make_signal(direction, confirming)).confidence
+        assert boosted == pytest.approx(neutral + scorer._score_obi_bonus(confirming, direction.name))
+        assert boosted > neutral
+
+        assert scorer.score(make_signal(direction, opposing)).confidence == pytest.approx(neutral)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -2,7 +2,10 @@
 
 import pytest
 import time
-from src.engine.consensus import ConsensusEngine
+import statistics
+from collections import deque
+
+from src.engine.consensus import ConsensusEngine, VolumeZScoreTracker
 from src.models.schemas import ExchangeMetrics, VolatilityRegime
 
 
@@ -164,6 +167,25 @@ class TestConsensusEngine:
         regime = consensus_engine._determine_volatility_regime(0.015)
         assert regime == VolatilityRegime.HIGH
     
+    def test_regime_thresholds_refresh_every_k_adds(self, consensus_engine):
+        """Test that cached p25/p75 are only recomputed after enough new ATR samples."""
+        for _ in range(50):
+            consensus_engine._atr_history.add(0.007)
+        assert consensus_engine._determine_volatility_regime(0.007) == VolatilityRegime.NORMAL
+        
+        # A few higher samples don't move the cached thresholds yet
+        for _ in range(5):
+            consensus_engine._atr_history.add(0.02)
+        assert consensus_engine._regime_thresholds == (0.007, 0.007)
+        consensus_engine._determine_volatility_regime(0.007)
+        assert consensus_engine._regime_thresholds == (0.007, 0.007)
+        
+        # After enough samples they are refreshed
+        for _ in range(60):
+            consensus_engine._atr_history.add(0.02)
+        consensus_engine._determine_volatility_regime(0.007)
+        assert consensus_engine._regime_thresholds == (0.007, 0.02)
+    
     def test_volume_surge_calculation(
         self,
         consensus_engine,
@@ -197,7 +219,10 @@ class TestPriceAgreement:
         ]
         
         # Expected: (100*1000 + 102*2000) / 3000 = 101.33
-        result = consensus_engine._weighted_average(metrics)
+        result = consensus_engine._weighted_average(
+            [m.current_price for m in metrics],
+            [m.volume_1m for m in metrics],
+        )
         assert abs(result - 101.333) < 0.01
     
     def test_median_price(self, consensus_engine):
@@ -211,10 +236,44 @@ class TestPriceAgreement:
                           exchange_timestamp_ms=0, local_timestamp_ms=0),
         ]
         
-        result = consensus_engine._median_price(metrics)
+        result = consensus_engine._median_price([m.current_price for m in metrics])
         assert result == 102
 
 
+class TestVolumeZScoreTracker:
+    """Tests for the running-statistics volume tracker."""
+    
+    def test_running_stats_match_window_after_eviction(self):
+        """Test that incremental mean/std track the bounded window exactly."""
+        tracker = VolumeZScoreTracker(history=deque(maxlen=50))
+        for i in range(120):
+            tracker.add(float((i * 37) % 101))
+        
+        values = list(tracker.history)
+        mean = statistics.fmean(values)
+        std = statistics.pstdev(values)
+        
+        assert len(values) == 50
+        assert tracker.mean == pytest.approx(mean)
+        assert tracker.get_zscore(200.0) == pytest.approx((200.0 - mean) / std)
+    
+    def test_constant_window_has_zero_zscore(self):
+        """Test that rounding residue from eviction doesn't fake a surge."""
+        tracker = VolumeZScoreTracker(history=deque(maxlen=50))
+        for i in range(10):
+            tracker.add(float((i * 37) % 101) / 7)
+        for _ in range(50):
+            tracker.add(5.0)
+        
+        assert tracker.get_zscore(5.0) == 0.0
+        assert tracker.get_zscore(6.0) == 0.0
+        assert tracker.get_surge_ratio(6.0) == 1.0
+        
+        for _ in range(300):
+            tracker.add(5.0)
+        assert tracker.get_zscore(6.0) == 0.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
@@ -0,0 +1,112 @@
+"""Tests for execution engine helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from src.engine.execution import ExecutionEngine, NonceTracker
+
+
+class TestNonceTracker:
+    """Tests for NonceTracker nonce allocation."""
+
+    def test_sequential_nonces_from_confirmed(self):
+        """Test that nonces count up from the confirmed nonce."""
+        tracker = NonceTracker(confirmed_nonce=5)
+
+        assert [tracker.get_next(tracker.confirmed_nonce) for _ in range(3)] == [5, 6, 7]
+        assert tracker.pending_nonces == {5, 6, 7}
+
+    def test_released_nonce_is_reused_first(self):
+        """Test that a released nonce fills the gap before new ones are issued."""
+        tracker = NonceTracker(confirmed_nonce=0)
+        for _ in range(3):
+            tracker.get_next(0)
+
+        tracker.release(1)
+        assert tracker.get_next(0) == 1
+        assert tracker.get_next(0) == 3
+
+    def test_confirm_skips_stale_holes(self):
+        """Test that holes below the confirmed nonce are never handed out."""
+        tracker = NonceTracker(confirmed_nonce=0)
+        for _ in range(3):
+            tracker.get_next(0)
+
+        tracker.release(0)
+        tracker.confirm(2)
+        assert tracker.get_next(tracker.confirmed_nonce) == 3
+
+    def test_resync_restarts_from_chain_nonce(self):
+        """Test that resync moves the counter back but skips pending nonces."""
+        tracker = NonceTracker(confirmed_nonce=0)
+        for _ in range(4):
+            tracker.get_next(0)
+        tracker.confirm(0)
+        tracker.release(1)
+
+        tracker.resync(1)
+        assert tracker.get_next(tracker.confirmed_nonce) == 1
+        assert tracker.get_next(tracker.confirmed_nonce) == 4
+
+
+class FakeChainlinkFeed:
+    """Chainlink feed stub that counts oracle reads."""
+
+    def __init__(self, oracle_age_seconds: float):
+        self.oracle_age_seconds = oracle_age_seconds
+        self.reads = 0
+
+    def get_data(self):
+        self.reads += 1
+        return SimpleNamespace(oracle_age_seconds=self.oracle_age_seconds)
+
+
+class TestManagePositionsBatch:
+    """Tests for ExecutionEngine.manage_positions_batch."""
+
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        """Engine whose manage_position is replaced by a recording stub."""
+        engine = ExecutionEngine("http://localhost", "0x0", "11" * 32, chainlink_feed=FakeChainlinkFeed(42.0))
+        engine.calls = []
+
+        async def manage_position(signal_id, current_price, spread, oracle_age=None):
+            engine.calls.append((signal_id, oracle_age))
+            # Finish in reverse order of submission
+            await asyncio.sleep(0.01 / current_price)
+            if signal_id == "fails":
+                raise RuntimeError("boom")
+            return f"closed-{signal_id}"
+
+        monkeypatch.setattr(engine, "manage_position", manage_position)
+        return engine
+
+    @pytest.mark.asyncio
+    async def test_results_in_input_order(self, engine):
+        """Test that outcomes line up with the ticks, not with completion order."""
+        ticks = {"a": (1.0, 0.01), "b": (2.0, 0.01), "c": (3.0, 0.01)}
+
+        assert await engine.manage_positions_batch(ticks) == ["closed-a", "closed-b", "closed-c"]
+
+    @pytest.mark.asyncio
+    async def test_oracle_read_once_per_batch(self, engine):
+        """Test that every position gets the same oracle age from a single read."""
+        ticks = {"a": (1.0, 0.01), "b": (2.0, 0.01), "c": (3.0, 0.01)}
+
+        await engine.manage_positions_batch(ticks)
+
+        assert engine._chainlink_feed.reads == 1
+        assert [age for _, age in engine.calls] == [42.0, 42.0, 42.0]
+
+    @pytest.mark.asyncio
+    async def test_failed_position_is_none_without_cancelling_others(self, engine):
+        """Test that one failing position doesn't stop the rest of the batch."""
+        ticks = {"a": (1.0, 0.01), "fails": (2.0, 0.01), "c": (3.0, 0.01)}
+
+        assert await engine.manage_positions_batch(ticks) == ["closed-a", None, "closed-c"]
+        assert [signal_id for signal_id, _ in engine.calls] == ["a", "fails", "c"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
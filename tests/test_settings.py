@@ -0,0 +1,127 @@
+"""Tests for the settings environment loader."""
+
+import importlib
+
+import pytest
+from pydantic import ValidationError
+
+from config.settings import reload_settings
+
+# config/__init__ re-exports the `settings` instance under the module's name
+settings_module = importlib.import_module("config.settings")
+
+
+@pytest.fixture(autouse=True)
+def restore_settings():
+    """Put the original settings singleton back after each test."""
+    original = settings_module._settings
+    yield
+    settings_module._settings = original
+
+
+class TestEnvLoader:
+    """Tests for turning flat env keys into nested Settings."""
+
+    def test_nested_keys(self):
+        """Test that GROUP__FIELD and GROUP__SUB__FIELD reach nested groups."""
+        s = reload_settings({
+            "SIGNALS__MIN_DIVERGENCE_PCT": "0.06",
+            "ASSET_CONFIGS__ETH__MIN_LIQUIDITY_EUR": "12.5",
+        })
+
+        assert s.signals.min_divergence_pct == 0.06
+        assert s.asset_configs.get("ETH").min_liquidity_eur == 12.5
+
+    def test_names_are_case_insensitive(self):
+        """Test that key case doesn't matter at any nesting level."""
+        s = reload_settings({"mode": "alert", "Signals__Min_Divergence_Pct": "0.06"})
+
+        assert s.mode == "alert"
+        assert s.signals.min_divergence_pct == 0.06
+
+    def test_os_environ_overrides_env_file(self, tmp_path, monkeypatch):
+        """Test that the process environment takes precedence over .env."""
+        env_file = tmp_path / ".env"
+        env_file.write_text("MODE=alert\nLOG_LEVEL=DEBUG\n")
+        monkeypatch.setenv("MODE", "night_auto")
+
+        env = settings_module._read_env(str(env_file))
+        s = reload_settings(env)
+
+        assert s.mode == "night_auto"
+        assert s.log_level == "DEBUG"
+
+    def test_json_symbols(self):
+        """Test that EXCHANGES__SYMBOLS is decoded from JSON."""
+        s = reload_settings({"EXCHANGES__SYMBOLS": '{"BTC": {"binance": "btcusdc"}}'})
+
+        assert s.exchanges.symbols["BTC"]["binance"] == "btcusdc"
+        assert "ETH" not in s.exchanges.symbols
+
+    def test_unknown_keys_are_ignored(self):
+        """Test that unrelated env vars and unknown fields don't fail validation."""
+        s = reload_settings({
+            "PATH": "/usr/bin",
+            "SIGNALS__NOT_A_FIELD": "1",
+            "NOT_A_GROUP__MODE": "alert",
+        })
+
+        assert s.mode == "shadow"
+
+    def test_scalar_field_keeps_json_like_string(self):
+        """Test that str fields aren't JSON-decoded even if they look like JSON."""
+        s = reload_settings({"POLYMARKET__BTC_UP_MARKET_ID": "[not-json]"})
+
+        assert s.polymarket.btc_up_market_id == "[not-json]"
+
+    def test_malformed_json_is_a_validation_error(self):
+        """Test that invalid JSON for a complex field raises ValidationError."""
+        with pytest.raises(ValidationError):
+            reload_settings({"EXCHANGES__SYMBOLS": "{not json"})
+
+
+class TestUnprefixedFallback:
+    """Tests for bare sub-group field names (POLYGON_RPC_URL, ...)."""
+
+    def test_bare_names_reach_sub_groups(self):
+        """Test that documented bare names still configure their groups."""
+        s = reload_settings({
+            "DISCORD_WEBHOOK_URL": "https://discord.example/hook",
+            "POLYGON_RPC_URL": "https://rpc.example",
+            "MIN_DIVERGENCE_PCT": "0.07",
+        })
+
+        assert s.alerts.discord_webhook_url == "https://discord.example/hook"
+        assert s.chainlink.polygon_rpc_url == "https://rpc.example"
+        assert s.signals.min_divergence_pct == 0.07
+
+    def test_prefixed_name_wins(self):
+        """Test that GROUP__FIELD takes precedence over the bare name."""
+        s = reload_settings({
+            "MIN_DIVERGENCE_PCT": "0.07",
+            "SIGNALS__MIN_DIVERGENCE_PCT": "0.09",
+        })
+
+        assert s.signals.min_divergence_pct == 0.09
+
+
+class TestFrozenSettings:
+    """Tests for the frozen settings models."""
+
+    def test_settings_are_hashable(self):
+        """Test that settings (including the symbols map) can be used as cache keys."""
+        s = reload_settings({"EXCHANGES__SYMBOLS": '{"BTC": {"binance": "btcusdt"}}'})
+
+        assert hash(s) == hash(reload_settings({"EXCHANGES__SYMBOLS": '{"BTC": {"binance": "btcusdt"}}'}))
+        assert hash(s.exchanges) != hash(reload_settings({}).exchanges)
+
+    def test_symbols_are_read_only(self):
+        """Test that the symbols map can't be mutated in place."""
+        s = reload_settings({})
+
+        with pytest.raises(TypeError):
+            s.exchanges.symbols["BTC"]["binance"] = "other"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])